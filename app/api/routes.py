@@ -1,32 +1,96 @@
-import time
-from typing import Dict, Any, Optional, List
-from fastapi import APIRouter, Query, Path, HTTPException, Depends
+import asyncio
+from functools import partial
+from typing import Dict, Any, Optional, List, Hashable, Callable, Awaitable
+from cachetools import TTLCache
+from fastapi import APIRouter, Query, Path, HTTPException, Depends, Response
 
-from app.config import logger
-from app.models.event import Event, SimpleEvent
-from app.models.search import SearchRequest, DateRange
-from app.scraper.scraper import EventbriteScraper
+from app.config import CACHE_TTL, CACHE_MAX_SIZE, logger
+from app.models.event import SimpleEvent
+from app.models.search import SearchRequest, SimpleSearchResponse, DateRange
+from app.scraper.scraper import AsyncEventbriteScraper
 
 # Create router
 router = APIRouter()
 
-# Create a scraper instance
-scraper = None
+# Shared scraper instance, created at startup and closed at shutdown
+scraper: Optional[AsyncEventbriteScraper] = None
 
-def get_scraper() -> EventbriteScraper:
+async def get_scraper() -> AsyncEventbriteScraper:
     """
-    Get or create a scraper instance.
+    Get or create the shared scraper instance.
+    
+    Declared async so FastAPI resolves it on the event loop instead of a
+    worker thread, which keeps creation of the singleton race-free.
     
     Returns:
-        EventbriteScraper instance
+        AsyncEventbriteScraper instance
     """
     global scraper
     if scraper is None:
-        scraper = EventbriteScraper(use_selenium=True)
+        scraper = AsyncEventbriteScraper()
     return scraper
 
 
-@router.get("/events/search", response_model=Dict[str, Any])
+# Recent scraper results, keyed by request parameters
+result_cache: TTLCache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL)
+
+# Scrapes currently in progress, so concurrent misses for the same key share one scrape
+_in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+
+def _store_result(key: Hashable, cacheable: Callable[[Any], bool], future: "asyncio.Future[Any]"):
+    """Move a finished scrape from the in-flight table into the result cache."""
+    _in_flight.pop(key, None)
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    if cacheable(result):
+        result_cache[key] = result
+
+
+async def get_cached(
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Any]],
+    cacheable: Callable[[Any], bool] = lambda result: result is not None
+) -> Any:
+    """
+    Return a cached result for key, or run fetch once and cache its result.
+    
+    Concurrent callers that miss on the same key await the same scrape
+    instead of each starting their own.
+    
+    Args:
+        key: Cache key
+        fetch: Coroutine function producing the result on a cache miss
+        cacheable: Predicate deciding whether a result should be cached
+        
+    Returns:
+        The cached or freshly fetched result
+    """
+    try:
+        return result_cache[key]
+    except KeyError:
+        pass
+    
+    future = _in_flight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        _in_flight[key] = future
+        future.add_done_callback(partial(_store_result, key, cacheable))
+    
+    # Shield the shared scrape so one cancelled request does not cancel it for the others
+    return await asyncio.shield(future)
+
+
+async def close_scraper():
+    """Close the shared scraper instance and release its connections."""
+    global scraper
+    if scraper is not None:
+        await scraper.aclose()
+        scraper = None
+
+
+@router.get("/events/search", response_model=SimpleSearchResponse)
 async def search_events(
     locations: Optional[List[str]] = Query(None, description="List of locations to search in"),
     keywords: Optional[List[str]] = Query(None, description="List of keywords to search for"),
@@ -35,8 +99,8 @@ async def search_events(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Number of results per page"),
     limit: Optional[int] = Query(None, ge=1, description="Maximum number of results to return"),
-    scraper: EventbriteScraper = Depends(get_scraper)
-) -> Dict[str, Any]:
+    scraper: AsyncEventbriteScraper = Depends(get_scraper)
+) -> Response:
     """
     Search for events with filters and return structured data with only id, title, and url.
     """
@@ -56,26 +120,34 @@ async def search_events(
             limit=limit
         )
         
-        # Search for events
-        result = scraper.search_events(search_request)
-        
-        # Simplify the response to include only id, title, and url
-        simplified_events = []
-        for event in result["events"]:
-            simplified_events.append({
-                "id": event.id,
-                "title": event.title,
-                "url": event.url
-            })
+        # Search for events, reusing a recent result for identical parameters
+        cache_key = (
+            "search",
+            tuple(locations or ()),
+            tuple(keywords or ()),
+            start_date,
+            end_date,
+            page,
+            page_size,
+            limit
+        )
+        result = await get_cached(
+            cache_key,
+            lambda: scraper.search_events_simple(search_request),
+            cacheable=lambda result: bool(result["events"])
+        )
         
-        # Return simplified response
-        return {
-            "events": simplified_events,
-            "total_count": result["total_count"],
-            "page": result["page"],
-            "page_size": result["page_size"],
-            "search_time_ms": result["search_time_ms"]
-        }
+        # Events are already simplified to id, title, and url by the scraper.
+        # Serialize with the model's compiled serializer and return the bytes
+        # directly, so FastAPI does not re-validate the response model.
+        response = SimpleSearchResponse(
+            events=result["events"],
+            total_count=result["total_count"],
+            page=result["page"],
+            page_size=result["page_size"],
+            search_time_ms=result["search_time_ms"]
+        )
+        return Response(content=response.model_dump_json(), media_type="application/json")
     
     except Exception as e:
         logger.error(f"Error in search_events: {e}")
@@ -88,13 +160,13 @@ async def search_events(
 @router.get("/events/{event_id}", response_model=SimpleEvent)
 async def get_event(
     event_id: str = Path(..., description="Event ID"),
-    scraper: EventbriteScraper = Depends(get_scraper)
+    scraper: AsyncEventbriteScraper = Depends(get_scraper)
 ) -> SimpleEvent:
     """
     Get simplified information about a specific event (id, title, url only).
     """
     try:
-        event = scraper.get_event_details(event_id)
+        event = await get_cached(("event", event_id), lambda: scraper.get_event_details(event_id))
         
         if not event:
             raise HTTPException(
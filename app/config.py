@@ -1,5 +1,8 @@
 import os
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import List
 from dotenv import load_dotenv
 
@@ -10,11 +13,24 @@ load_dotenv()
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
 API_PORT = int(os.getenv("API_PORT", "8000"))
 DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "4"))
+ALLOWED_ORIGINS: List[str] = [
+    origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",") if origin.strip()
+]
 
 # Scraper Settings
 REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "2"))
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
+RETRY_BACKOFF_CAP = float(os.getenv("RETRY_BACKOFF_CAP", "30"))
+# Per worker process: the server as a whole sends up to WEB_CONCURRENCY times this rate
+MAX_REQUESTS_PER_SECOND = float(os.getenv("MAX_REQUESTS_PER_SECOND", "5"))
 USER_AGENT_ROTATION = os.getenv("USER_AGENT_ROTATION", "True").lower() in ("true", "1", "t")
+SAVE_HTML = os.getenv("SAVE_HTML", "False").lower() in ("true", "1", "t")
+
+# Cache Settings
+CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))
+CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "1024"))
+CONDITIONAL_CACHE_SIZE = int(os.getenv("CONDITIONAL_CACHE_SIZE", "64"))
 
 # User Agent List for rotation
 USER_AGENTS: List[str] = [
@@ -55,8 +71,14 @@ def setup_logging():
     )
     console_handler.setFormatter(formatter)
     
+    # Hand records to a queue so the handler's stream I/O runs on a background thread
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Add handler to logger
-    logger.addHandler(console_handler)
+    logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
@@ -1,10 +1,24 @@
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import RedirectResponse
 
-from app.config import API_HOST, API_PORT, DEBUG, logger
-from app.api.routes import router as api_router
+from app.config import API_HOST, API_PORT, DEBUG, WEB_CONCURRENCY, ALLOWED_ORIGINS, logger
+from app.api.routes import router as api_router, get_scraper, close_scraper
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the OpenAPI schema and create the shared scraper at startup; release it at shutdown."""
+    # Build the OpenAPI document now rather than on the first /docs request; FastAPI caches it
+    app.openapi()
+    
+    await get_scraper()
+    yield
+    await close_scraper()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -13,18 +27,23 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    debug=DEBUG
+    debug=DEBUG,
+    lifespan=lifespan
 )
 
-# Add CORS middleware
+# Add CORS middleware with a fixed allow list so headers are not echoed per request
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins
-    allow_credentials=True,
-    allow_methods=["*"],  # Allow all methods
-    allow_headers=["*"],  # Allow all headers
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials="*" not in ALLOWED_ORIGINS,  # Credentials cannot be combined with a wildcard origin
+    allow_methods=["GET"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# Compress larger responses, such as searches with many events
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Root endpoint
 @app.get("/", tags=["Health"])
 async def root():
@@ -40,10 +59,16 @@ if __name__ == "__main__":
     
     logger.info(f"Starting Eventbrite Scraper API on {API_HOST}:{API_PORT} (Debug: {DEBUG})")
     
+    # uvicorn cannot reload with multiple workers, so debug mode runs a single one
     uvicorn.run(
         "app.main:app",
         host=API_HOST,
         port=API_PORT,
         reload=DEBUG,
-        log_level="debug" if DEBUG else "info"
+        workers=1 if DEBUG else WEB_CONCURRENCY,
+        loop="uvloop",
+        http="httptools",
+        log_level="debug" if DEBUG else "info",
+        # Skip formatting a log line per request outside debug mode
+        access_log=DEBUG
     )
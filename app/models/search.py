@@ -1,9 +1,8 @@
 """Search models for the Eventbrite scraper."""
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from pydantic import BaseModel, validator
+from typing import List, Optional
+from pydantic import BaseModel, Field
 
-from app.models.event import Event
+from app.models.event import Event, SimpleEvent
 
 
 class DateRange(BaseModel):
@@ -26,27 +25,9 @@ class SearchRequest(BaseModel):
     keywords: Optional[List[str]] = None
     date_range: Optional[DateRange] = None
     price_range: Optional[PriceRange] = None
-    page: int = 1
-    page_size: int = 20
-    limit: Optional[int] = None
-
-    @validator('page')
-    def page_must_be_positive(cls, v):
-        if v < 1:
-            raise ValueError('page must be greater than 0')
-        return v
-
-    @validator('page_size')
-    def page_size_must_be_valid(cls, v):
-        if v < 1 or v > 100:
-            raise ValueError('page_size must be between 1 and 100')
-        return v
-
-    @validator('limit')
-    def limit_must_be_positive(cls, v):
-        if v is not None and v < 1:
-            raise ValueError('limit must be greater than 0')
-        return v
+    page: int = Field(1, ge=1)
+    page_size: int = Field(20, ge=1, le=100)
+    limit: Optional[int] = Field(None, ge=1)
 
 
 class SearchResponse(BaseModel):
@@ -55,4 +36,13 @@ class SearchResponse(BaseModel):
     total_count: int
     page: int
     page_size: int
-    search_time_ms: int 
\ No newline at end of file
+    search_time_ms: int 
+
+
+class SimpleSearchResponse(BaseModel):
+    """Model for search response with simplified events."""
+    events: List[SimpleEvent]
+    total_count: int
+    page: int
+    page_size: int
+    search_time_ms: int
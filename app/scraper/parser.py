@@ -1,11 +1,279 @@
 import re
-import json
+import sys
+import logging
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime
-from bs4 import BeautifulSoup, Tag
+from itertools import islice
+import soupsieve as sv
+import orjson
+from pydantic import ValidationError
+from bs4 import BeautifulSoup, ElementFilter, Tag
 
-from app.config import logger
-from app.models.event import Event, Location, Organizer, Price, Coordinates
+# Prefer the C-based lxml parser; fall back to the pure-Python parser when it is not installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# ISO 8601 parsing: ciso8601 when installed, otherwise fromisoformat, which
+# only accepts a trailing "Z" from Python 3.11 on
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_dt = datetime.fromisoformat
+    else:
+        def _parse_dt(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+from app.config import SAVE_HTML, logger
+from app.models.event import Event, SimpleEvent, Location, Organizer, Price, Coordinates
+
+# schema.org types accepted as event JSON-LD
+_VALID_EVENT_TYPES = frozenset({"Event", "SocialEvent", "BusinessEvent", "EducationEvent"})
+
+# JSON-LD address fields joined into Location.address, and fields reported as categories
+_ADDR_FIELDS = ("streetAddress", "addressLocality", "addressRegion", "postalCode")
+_CATEGORY_FIELDS = ("eventAttendanceMode", "eventStatus")
+
+# Event card selectors on search results pages; the first one that matches anything wins
+_EVENT_CARD_SELECTORS = (
+    "div[data-testid='event-card']",
+    ".search-event-card-wrapper",
+    ".eds-event-card-content",
+    ".eds-event-card",
+    "[data-spec='event-card']",
+    "article.eds-l-pad-all-4",  # Another possible selector
+    "div.eds-event-card-content__content-container"  # Another possible selector
+)
+
+# Elements that may hold the total result count, and pagination containers
+_TOTAL_COUNT_SELECTORS = (
+    "[data-testid='search-results-header']",
+    ".eds-text-hl",
+    "h1",
+    ".search-results-header"
+)
+_PAGINATION_SELECTORS = (".pagination", ".eds-pagination", "[data-spec='pagination']")
+
+# Event ID at the end of an event URL slug, e.g. /e/jazz-night-tickets-123
+_EVENT_ID_RE = re.compile(r'/e/[^/]+-(\d+)')
+# Result count in a search results header, e.g. "42 events"
+_COUNT_RE = re.compile(r'(\d+)\s+events?')
+# JSON-LD script blocks in raw HTML, capturing the script contents
+_JSON_LD_RE = re.compile(
+    r'<script\b[^>]*\stype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.DOTALL | re.IGNORECASE
+)
+# "Free" anywhere in a price string, in any case
+_FREE_RE = re.compile(r'free', re.IGNORECASE)
+
+
+class SelectorChain:
+    """
+    Ordered fallback chain of CSS selectors, compiled once at import time.
+    
+    select_first returns the same element as trying each selector in turn
+    with select_one, but walks the tree once using the union of all selectors
+    and ranks the matches by selector priority.
+    """
+    
+    def __init__(self, *selectors: str):
+        self.selectors = selectors
+        self._compiled = tuple(sv.compile(selector) for selector in selectors)
+        self._union = sv.compile(", ".join(selectors))
+    
+    def select_first(self, tag: Tag) -> Tuple[Optional[Tag], Optional[str]]:
+        """
+        Find the first descendant matching the highest-priority selector.
+        
+        Args:
+            tag: Tag to search under
+            
+        Returns:
+            Tuple of (matching element, selector that matched), or (None, None)
+        """
+        best = None
+        best_rank = len(self._compiled)
+        for elem in self._union.iselect(tag):
+            for rank in range(best_rank):
+                if self._compiled[rank].match(elem):
+                    best, best_rank = elem, rank
+                    break
+            if best_rank == 0:
+                break
+        
+        if best is None:
+            return None, None
+        return best, self.selectors[best_rank]
+
+
+# Field selectors for event cards on search results pages, in priority order
+_CARD_TITLE_SELECTORS = SelectorChain(
+    "[data-testid='event-card-title']",
+    ".eds-event-card__formatted-name--is-clamped",
+    ".eds-event-card__formatted-name",
+    ".card-text--truncated__one",
+    "h3"
+)
+_CARD_DATE_SELECTORS = SelectorChain(
+    "[data-testid='event-card-date']",
+    ".eds-event-card-content__sub-title",
+    ".card-text--truncated__two",
+    "time"
+)
+_CARD_LOCATION_SELECTORS = SelectorChain(
+    "[data-testid='event-card-location']",
+    ".card-text--truncated__one",
+    ".eds-event-card-content__sub-title:nth-child(2)",
+    "p.location"
+)
+_CARD_PRICE_SELECTORS = SelectorChain(
+    "[data-testid='event-card-price']",
+    ".eds-event-card-content__sub-title:nth-child(3)",
+    ".eds-text-color--ui-600",
+    "p.price"
+)
+_CARD_LINK_SELECTORS = SelectorChain("a[href*='/e/']")
+_CARD_IMG_SELECTORS = SelectorChain("img")
+
+# Selector chains for each card field, and the subset parse_search_results_simple needs
+_CARD_FIELD_CHAINS = {
+    "link": _CARD_LINK_SELECTORS,
+    "title": _CARD_TITLE_SELECTORS,
+    "date": _CARD_DATE_SELECTORS,
+    "location": _CARD_LOCATION_SELECTORS,
+    "img": _CARD_IMG_SELECTORS,
+    "price": _CARD_PRICE_SELECTORS
+}
+_CARD_SIMPLE_FIELD_CHAINS = {
+    "link": _CARD_LINK_SELECTORS,
+    "title": _CARD_TITLE_SELECTORS
+}
+# data-testid values of current Eventbrite cards; each is the top selector of its field's chain
+_CARD_FIELD_TESTIDS = {
+    "event-card-title": "title",
+    "event-card-date": "date",
+    "event-card-location": "location",
+    "event-card-price": "price"
+}
+
+# Field selectors for event details pages, in priority order
+_DETAILS_TITLE_SELECTORS = SelectorChain(
+    "[data-testid='event-title']",
+    ".event-title",
+    "h1",
+    ".eds-text-hl"
+)
+_DETAILS_DESC_SELECTORS = SelectorChain(
+    "[data-testid='event-description']",
+    ".event-description",
+    ".eds-text-bs",
+    "section.eds-structure__content"
+)
+_DETAILS_DATE_SELECTORS = SelectorChain(
+    "[data-testid='event-date']",
+    ".event-details__data",
+    "time",
+    ".date-info"
+)
+_DETAILS_VENUE_SELECTORS = SelectorChain(
+    "[data-testid='venue-name']",
+    ".event-details__data--venue",
+    ".location-info__venue",
+    "p.venue-name"
+)
+_DETAILS_ADDRESS_SELECTORS = SelectorChain(
+    "[data-testid='venue-address']",
+    ".event-details__data--address",
+    ".location-info__address",
+    "p.address"
+)
+_DETAILS_ORG_SELECTORS = SelectorChain(
+    "[data-testid='organizer-name']",
+    ".organizer-name",
+    ".organizer-info__name",
+    "a[href*='/o/']"
+)
+_DETAILS_ORG_DESC_SELECTORS = SelectorChain(
+    "[data-testid='organizer-description']",
+    ".organizer-description",
+    ".organizer-info__description"
+)
+_DETAILS_PRICE_SELECTORS = SelectorChain(
+    "[data-testid='ticket-price']",
+    ".ticket-price",
+    ".eds-text-color--ui-600",
+    "span.price"
+)
+_DETAILS_IMG_SELECTORS = SelectorChain(
+    "[data-testid='event-image']",
+    ".event-header__image img",
+    ".eds-event-details-page__image img",
+    "img.event-image"
+)
+
+# Category and tag selectors on event details pages; every match is collected.
+# .eds-text-color--ui-600 is only listed for categories: any text it matches is
+# already a category, so it could never add a tag.
+_DETAILS_CATEGORY_SELECTORS = (
+    "[data-testid='event-category']",
+    ".event-category",
+    ".eds-text-color--ui-600"
+)
+_DETAILS_TAG_SELECTORS = (
+    "[data-testid='event-tag']",
+    ".event-tag"
+)
+
+
+class DetailsPageFilter(ElementFilter):
+    """
+    Parse filter that only builds the parts of an event page the details selectors read.
+    
+    A tag is kept, with its whole subtree, when it is the subject of one of the
+    _DETAILS_* selectors (or the ancestor named in a descendant selector). Other
+    tags are dropped but their children are still considered, so kept elements
+    keep their document order, attributes and text.
+    Keep these sets in sync with the selectors above.
+    """
+    
+    TESTIDS = frozenset({
+        "event-title", "event-description", "event-date", "venue-name", "venue-address",
+        "organizer-name", "organizer-description", "ticket-price", "event-image",
+        "event-category", "event-tag"
+    })
+    CLASSES = frozenset({
+        "event-title", "eds-text-hl", "event-description", "eds-text-bs", "eds-structure__content",
+        "event-details__data", "date-info", "event-details__data--venue", "location-info__venue",
+        "venue-name", "event-details__data--address", "location-info__address", "address",
+        "organizer-name", "organizer-info__name", "organizer-description",
+        "organizer-info__description", "ticket-price", "eds-text-color--ui-600", "price",
+        "event-header__image", "eds-event-details-page__image", "event-image",
+        "event-category", "event-tag"
+    })
+    TAGS = frozenset({"h1", "time"})
+    
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Dict[str, str]]) -> bool:
+        if name in self.TAGS:
+            return True
+        if not attrs:
+            return False
+        if name == "script":
+            return attrs.get("type") == "application/ld+json"
+        if name == "a" and "/o/" in attrs.get("href", ""):
+            return True
+        if attrs.get("data-testid") in self.TESTIDS:
+            return True
+        return not self.CLASSES.isdisjoint(attrs.get("class", "").split())
+    
+    def allow_string_creation(self, string: str) -> bool:
+        # Text outside kept tags is never read
+        return False
+
+
+_DETAILS_FILTER = DetailsPageFilter()
 
 
 class EventParser:
@@ -28,68 +296,31 @@ class EventParser:
         total_count = 0
         
         try:
-            # Parse HTML content
-            soup = BeautifulSoup(html_content, "html.parser")
-            
-            # Try to find the event cards with different selectors
-            event_cards = []
-            selectors = [
-                "div[data-testid='event-card']",
-                ".search-event-card-wrapper",
-                ".eds-event-card-content",
-                ".eds-event-card",
-                "[data-spec='event-card']",
-                "article.eds-l-pad-all-4",  # Another possible selector
-                "div.eds-event-card-content__content-container"  # Another possible selector
-            ]
-            
-            for selector in selectors:
-                cards = soup.select(selector)
-                if cards:
-                    logger.info(f"Found {len(cards)} event cards with selector: {selector}")
-                    event_cards = cards
-                    break
+            # Fast path: search pages list their events as JSON-LD, which a
+            # regex scan of the raw HTML finds without parsing the page at all
+            json_ld_items = self._extract_search_json_ld_fast(html_content)
+            if json_ld_items:
+                for event_id, event_url, data in json_ld_items:
+                    event = self._parse_from_json_ld(data, event_id, event_url)
+                    if event:
+                        events.append(event)
+                if events:
+                    logger.info(f"Parsed {len(events)} events from search results JSON-LD")
+                    return events
             
-            if not event_cards:
-                # Last resort: look for any links that might be event links
-                event_links = soup.select("a[href*='/e/']")
-                if event_links:
-                    logger.info(f"Found {len(event_links)} event links")
-                    # Try to find parent elements that might be event cards
-                    for link in event_links:
-                        parent = link.parent
-                        for _ in range(3):  # Look up to 3 levels up
-                            if parent and parent.name == 'div':
-                                event_cards.append(parent)
-                                break
-                            parent = parent.parent if parent else None
-                    
-                    if event_cards:
-                        logger.info(f"Extracted {len(event_cards)} potential event cards from links")
-                    else:
-                        logger.warning("Could not extract event cards from links")
+            # Parse HTML content
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             
+            event_cards = self._find_event_cards(soup, html_content)
             if not event_cards:
-                logger.warning("No event cards found in search results")
-                # Save the HTML structure for debugging
-                with open("eventbrite_structure.txt", "w", encoding="utf-8") as f:
-                    f.write(str(soup.prettify()))
-                logger.debug("HTML structure saved to eventbrite_structure.txt")
                 return []
             
             # Try to find total count with different selectors
-            total_count_selectors = [
-                "[data-testid='search-results-header']",
-                ".eds-text-hl",
-                "h1",
-                ".search-results-header"
-            ]
-            
-            for selector in total_count_selectors:
+            for selector in _TOTAL_COUNT_SELECTORS:
                 elements = soup.select(selector)
                 for elem in elements:
                     text = elem.get_text()
-                    count_match = re.search(r'(\d+)\s+events?', text)
+                    count_match = _COUNT_RE.search(text)
                     if count_match:
                         total_count = int(count_match.group(1))
                         logger.info(f"Found total count: {total_count} with selector: {selector}")
@@ -99,13 +330,12 @@ class EventParser:
             
             # If we couldn't find the total count, estimate based on pagination
             if total_count == 0:
-                pagination_selectors = [".pagination", ".eds-pagination", "[data-spec='pagination']"]
-                for selector in pagination_selectors:
+                for selector in _PAGINATION_SELECTORS:
                     pagination = soup.select_one(selector)
                     if pagination:
                         try:
                             last_page_elem = pagination.select("li")[-2]
-                            last_page = last_page_elem.get_text().strip()
+                            last_page = last_page_elem.get_text(" ", strip=True)
                             total_count = int(last_page) * page_size
                             logger.info(f"Estimated total count from pagination: {total_count}")
                             break
@@ -120,11 +350,11 @@ class EventParser:
             # Parse each event card
             for i, card in enumerate(event_cards):
                 try:
-                    logger.debug(f"Parsing event card {i+1}/{len(event_cards)}")
+                    logger.debug("Parsing event card %d/%d", i+1, len(event_cards))
                     event = self._parse_event_card(card)
                     if event:
                         events.append(event)
-                        logger.debug(f"Successfully parsed event: {event.title}")
+                        logger.debug("Successfully parsed event: %s", event.title)
                     else:
                         logger.warning(f"Failed to parse event card {i+1}")
                 except Exception as e:
@@ -135,11 +365,112 @@ class EventParser:
             return events
             
         except Exception as e:
-            logger.error(f"Error parsing search results: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error parsing search results: {e}")
             return []
     
+    def parse_search_results_simple(self, html_content: str) -> List[SimpleEvent]:
+        """
+        Parse only the id, title and url of each event in search results.
+        
+        This skips building the nested location and price models that
+        parse_search_results creates for every card.
+        
+        Args:
+            html_content: HTML content of search results page
+            
+        Returns:
+            List of simplified events
+        """
+        events = []
+        
+        try:
+            # Upstream JSON is not trusted, so these events are validated
+            for event_id, event_url, data in self._extract_search_json_ld_fast(html_content):
+                try:
+                    events.append(SimpleEvent(
+                        id=event_id,
+                        title=data.get("name", "Unknown Event"),
+                        url=event_url
+                    ))
+                except ValidationError as e:
+                    logger.warning(f"Skipping invalid JSON-LD event {event_id}: {e}")
+            if events:
+                logger.info(f"Parsed {len(events)} events from search results JSON-LD")
+                return events
+            
+            soup = BeautifulSoup(html_content, HTML_PARSER)
+            
+            for i, card in enumerate(self._find_event_cards(soup, html_content)):
+                fields = self._find_card_fields(card, _CARD_SIMPLE_FIELD_CHAINS)
+                link = self._extract_card_link(fields["link"][0])
+                if not link:
+                    logger.warning(f"Failed to parse event card {i+1}")
+                    continue
+                
+                event_id, event_url = link
+                events.append(SimpleEvent.model_construct(
+                    id=event_id,
+                    title=self._extract_card_title(*fields["title"]),
+                    url=event_url
+                ))
+            
+            logger.info(f"Parsed {len(events)} events from search results")
+            return events
+            
+        except Exception as e:
+            logger.exception(f"Error parsing search results: {e}")
+            return []
+    
+    def _find_event_cards(self, soup: BeautifulSoup, html_content: str) -> List[Tag]:
+        """
+        Find the event cards on a search results page.
+        
+        Args:
+            soup: BeautifulSoup object of search results page
+            html_content: Raw HTML the soup was built from, saved when no cards are found
+            
+        Returns:
+            List of event card tags (empty if none were found)
+        """
+        # Try to find the event cards with different selectors
+        event_cards = []
+        for selector in _EVENT_CARD_SELECTORS:
+            cards = soup.select(selector)
+            if cards:
+                logger.info(f"Found {len(cards)} event cards with selector: {selector}")
+                event_cards = cards
+                break
+        
+        if not event_cards:
+            # Last resort: look for any links that might be event links
+            event_links = soup.select("a[href*='/e/']")
+            if event_links:
+                logger.info(f"Found {len(event_links)} event links")
+                # Try to find parent elements that might be event cards: the nearest
+                # div up to 3 levels up, counting each div once even if it holds several links
+                seen = set()
+                for link in event_links:
+                    parent = next((p for p in islice(link.parents, 3) if p.name == 'div'), None)
+                    if parent is not None and id(parent) not in seen:
+                        seen.add(id(parent))
+                        event_cards.append(parent)
+                
+                if event_cards:
+                    logger.info(f"Extracted {len(event_cards)} potential event cards from links")
+                else:
+                    logger.warning("Could not extract event cards from links")
+        
+        if not event_cards:
+            logger.warning("No event cards found in search results")
+            # Save the raw HTML for debugging if needed
+            if SAVE_HTML:
+                with open("eventbrite_structure.txt", "w", encoding="utf-8") as f:
+                    f.write(html_content)
+                logger.debug("HTML structure saved to eventbrite_structure.txt")
+            return []
+        
+        return event_cards
+    
     def _parse_event_card(self, card: Tag) -> Optional[Event]:
         """
         Parse event data from a single event card.
@@ -151,110 +482,55 @@ class EventParser:
             Event object if parsing successful, None otherwise
         """
         try:
-            # Debug the card HTML
-            card_html = str(card)
-            logger.debug(f"Card HTML length: {len(card_html)}")
-            if len(card_html) < 100:
-                logger.warning("Card HTML is suspiciously short")
-                logger.debug(f"Card HTML: {card_html}")
-            
-            # Extract event ID and URL
-            link_elem = card.select_one("a[href*='/e/']")
-            if not link_elem:
-                logger.warning("No event link found in card")
+            # Debug the card HTML; serializing the card is only worth it when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                card_html = str(card)
+                logger.debug("Card HTML length: %d", len(card_html))
+                if len(card_html) < 100:
+                    logger.warning("Card HTML is suspiciously short")
+                    logger.debug("Card HTML: %s", card_html)
+            
+            fields = self._find_card_fields(card, _CARD_FIELD_CHAINS)
+            
+            link = self._extract_card_link(fields["link"][0])
+            if not link:
                 return None
             
-            event_url = link_elem.get("href", "")
-            logger.debug(f"Found event URL: {event_url}")
-            
-            if not event_url.startswith("http"):
-                event_url = f"https://www.eventbrite.com{event_url}"
-                logger.debug(f"Converted to absolute URL: {event_url}")
-            
-            event_id_match = re.search(r'/e/[^/]+-(\d+)', event_url)
-            if not event_id_match:
-                logger.warning(f"Could not extract event ID from URL: {event_url}")
-                return None
-            
-            event_id = event_id_match.group(1)
-            logger.debug(f"Extracted event ID: {event_id}")
-            
-            # Extract title with multiple possible selectors
-            title_selectors = [
-                "[data-testid='event-card-title']",
-                ".eds-event-card__formatted-name--is-clamped",
-                ".eds-event-card__formatted-name",
-                ".card-text--truncated__one",
-                "h3"
-            ]
-            
-            title = "Unknown Event"
-            for selector in title_selectors:
-                title_elem = card.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text().strip()
-                    logger.debug(f"Found title with selector '{selector}': {title}")
-                    break
-            
-            # Extract date with multiple possible selectors
-            date_selectors = [
-                "[data-testid='event-card-date']",
-                ".eds-event-card-content__sub-title",
-                ".card-text--truncated__two",
-                "time"
-            ]
+            event_id, event_url = link
+            title = self._extract_card_title(*fields["title"])
             
+            # Extract date
             date_str = ""
-            for selector in date_selectors:
-                date_elem = card.select_one(selector)
-                if date_elem:
-                    date_str = date_elem.get_text().strip()
-                    logger.debug(f"Found date with selector '{selector}': {date_str}")
-                    break
-            
-            # Extract location with multiple possible selectors
-            location_selectors = [
-                "[data-testid='event-card-location']",
-                ".card-text--truncated__one",
-                ".eds-event-card-content__sub-title:nth-child(2)",
-                "p.location"
-            ]
+            date_elem, selector = fields["date"]
+            if date_elem:
+                date_str = date_elem.get_text(" ", strip=True)
+                logger.debug("Found date with selector '%s': %s", selector, date_str)
             
+            # Extract location
             location_str = ""
-            for selector in location_selectors:
-                location_elem = card.select_one(selector)
-                if location_elem:
-                    location_str = location_elem.get_text().strip()
-                    logger.debug(f"Found location with selector '{selector}': {location_str}")
-                    break
+            location_elem, selector = fields["location"]
+            if location_elem:
+                location_str = location_elem.get_text(" ", strip=True)
+                logger.debug("Found location with selector '%s': %s", selector, location_str)
             
             # Extract image URL
-            img_elem = card.select_one("img")
             image_url = ""
+            img_elem = fields["img"][0]
             if img_elem:
                 image_url = img_elem.get("src", "")
-                logger.debug(f"Found image URL: {image_url}")
-            
-            # Extract price with multiple possible selectors
-            price_selectors = [
-                "[data-testid='event-card-price']",
-                ".eds-event-card-content__sub-title:nth-child(3)",
-                ".eds-text-color--ui-600",
-                "p.price"
-            ]
+                logger.debug("Found image URL: %s", image_url)
             
+            # Extract price
             price_str = ""
-            for selector in price_selectors:
-                price_elem = card.select_one(selector)
-                if price_elem:
-                    price_str = price_elem.get_text().strip()
-                    logger.debug(f"Found price with selector '{selector}': {price_str}")
-                    break
+            price_elem, selector = fields["price"]
+            if price_elem:
+                price_str = price_elem.get_text(" ", strip=True)
+                logger.debug("Found price with selector '%s': %s", selector, price_str)
             
-            is_free = "free" in price_str.lower()
+            is_free = bool(_FREE_RE.search(price_str))
             
             # Create location object
-            location = Location(
+            location = Location.model_construct(
                 venue=None,
                 address=None,
                 city=location_str,
@@ -264,15 +540,15 @@ class EventParser:
             )
             
             # Create price object
-            price = Price(
+            price = Price.model_construct(
                 currency="USD",  # Default, would need more parsing for accuracy
-                min=0 if is_free else None,
+                min=0.0 if is_free else None,
                 max=None,
                 is_free=is_free
             )
             
             # Create event object
-            event = Event(
+            event = Event.model_construct(
                 id=event_id,
                 title=title,
                 description=None,  # Would need to fetch event details for this
@@ -290,11 +566,98 @@ class EventParser:
             return event
             
         except Exception as e:
-            logger.error(f"Error parsing event card: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error parsing event card: {e}")
             return None
     
+    def _find_card_fields(
+        self, card: Tag, chains: Dict[str, SelectorChain]
+    ) -> Dict[str, Tuple[Optional[Tag], Optional[str]]]:
+        """
+        Find the elements holding each requested field of an event card.
+        
+        A single pass over the card picks up the event link, the image and the
+        data-testid fields. These are the top selector of their chains, so the
+        first match in document order is what the chain would return. Only
+        fields the pass did not find fall back to walking their selector chain.
+        
+        Args:
+            card: BeautifulSoup Tag object of event card
+            chains: Selector chain for each field to find, keyed by field name
+            
+        Returns:
+            (matching element, selector that matched) for each field, (None, None) if not found
+        """
+        found = {}
+        for elem in card.descendants:
+            if elem.name is None:
+                continue
+            
+            tag_field = None
+            if elem.name == "a" and "/e/" in elem.get("href", ""):
+                tag_field = "link"
+            elif elem.name == "img":
+                tag_field = "img"
+            
+            for field in (tag_field, _CARD_FIELD_TESTIDS.get(elem.get("data-testid"))):
+                if field in chains and field not in found:
+                    found[field] = (elem, chains[field].selectors[0])
+            if len(found) == len(chains):
+                return found
+        
+        for field, chain in chains.items():
+            if field not in found:
+                found[field] = chain.select_first(card)
+        return found
+    
+    def _extract_card_link(self, link_elem: Optional[Tag]) -> Optional[Tuple[str, str]]:
+        """
+        Extract the event ID and absolute URL from an event card's link.
+        
+        Args:
+            link_elem: First event link in the card, or None if it has none
+            
+        Returns:
+            Tuple of (event ID, event URL) if found, None otherwise
+        """
+        if not link_elem:
+            logger.warning("No event link found in card")
+            return None
+        
+        event_url = link_elem.get("href", "")
+        logger.debug("Found event URL: %s", event_url)
+        
+        if not event_url.startswith("http"):
+            event_url = f"https://www.eventbrite.com{event_url}"
+            logger.debug("Converted to absolute URL: %s", event_url)
+        
+        event_id_match = _EVENT_ID_RE.search(event_url)
+        if not event_id_match:
+            logger.warning(f"Could not extract event ID from URL: {event_url}")
+            return None
+        
+        event_id = event_id_match.group(1)
+        logger.debug("Extracted event ID: %s", event_id)
+        return event_id, event_url
+    
+    def _extract_card_title(self, title_elem: Optional[Tag], selector: Optional[str]) -> str:
+        """
+        Extract the event title from an event card's title element.
+        
+        Args:
+            title_elem: Title element found in the card, or None
+            selector: Selector that matched title_elem
+            
+        Returns:
+            Event title, or "Unknown Event" if none was found
+        """
+        # Extract title
+        title = "Unknown Event"
+        if title_elem:
+            title = title_elem.get_text(" ", strip=True)
+            logger.debug("Found title with selector '%s': %s", selector, title)
+        
+        return title
+    
     def parse_event_details(self, html_content: str, event_id: str) -> Optional[Event]:
         """
         Parse detailed event information from event page.
@@ -307,8 +670,15 @@ class EventParser:
             Event object if parsing successful, None otherwise
         """
         try:
-            # Parse HTML content
-            soup = BeautifulSoup(html_content, "html.parser")
+            # Fast path: most event pages embed the event as JSON-LD, which a
+            # regex scan of the raw HTML finds without parsing the page at all
+            json_ld_data = self._extract_event_json_ld_fast(html_content)
+            if json_ld_data:
+                logger.info("Found JSON-LD event data, using it for parsing")
+                return self._parse_from_json_ld(json_ld_data, event_id, "")
+            
+            # Parse HTML content, building only the elements the selectors below can match
+            soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_DETAILS_FILTER)
             
             # Try to extract JSON-LD data first (most reliable)
             json_ld_data = self._extract_json_ld(soup)
@@ -316,189 +686,98 @@ class EventParser:
                 logger.info("Found JSON-LD data, using it for parsing")
                 return self._parse_from_json_ld(json_ld_data, event_id, "")
             
-            # Extract title with multiple possible selectors
-            title_selectors = [
-                "[data-testid='event-title']",
-                ".event-title",
-                "h1",
-                ".eds-text-hl"
-            ]
-            
+            # Extract title
             title = "Unknown Event"
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text().strip()
-                    logger.debug(f"Found title with selector '{selector}': {title}")
-                    break
-            
-            # Extract description with multiple possible selectors
-            desc_selectors = [
-                "[data-testid='event-description']",
-                ".event-description",
-                ".eds-text-bs",
-                "section.eds-structure__content"
-            ]
+            title_elem, selector = _DETAILS_TITLE_SELECTORS.select_first(soup)
+            if title_elem:
+                title = title_elem.get_text(" ", strip=True)
+                logger.debug("Found title with selector '%s': %s", selector, title)
             
+            # Extract description
             description = None
-            for selector in desc_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    description = desc_elem.get_text().strip()
-                    logger.debug(f"Found description with selector '{selector}' (length: {len(description) if description else 0})")
-                    break
-            
-            # Extract date and time with multiple possible selectors
-            date_selectors = [
-                "[data-testid='event-date']",
-                ".event-details__data",
-                "time",
-                ".date-info"
-            ]
+            desc_elem, selector = _DETAILS_DESC_SELECTORS.select_first(soup)
+            if desc_elem:
+                description = desc_elem.get_text().strip()
+                logger.debug("Found description with selector '%s' (length: %d)", selector, len(description) if description else 0)
             
+            # Extract date and time
             date_str = ""
-            for selector in date_selectors:
-                date_elem = soup.select_one(selector)
-                if date_elem:
-                    date_str = date_elem.get_text().strip()
-                    logger.debug(f"Found date with selector '{selector}': {date_str}")
-                    break
+            date_elem, selector = _DETAILS_DATE_SELECTORS.select_first(soup)
+            if date_elem:
+                date_str = date_elem.get_text(" ", strip=True)
+                logger.debug("Found date with selector '%s': %s", selector, date_str)
             
             # Try to parse dates (this is simplified and would need more robust parsing)
             start_date = None
             end_date = None
             
-            # Extract location details with multiple possible selectors
-            venue_selectors = [
-                "[data-testid='venue-name']",
-                ".event-details__data--venue",
-                ".location-info__venue",
-                "p.venue-name"
-            ]
-            
+            # Extract location details
             venue = None
-            for selector in venue_selectors:
-                venue_elem = soup.select_one(selector)
-                if venue_elem:
-                    venue = venue_elem.get_text().strip()
-                    logger.debug(f"Found venue with selector '{selector}': {venue}")
-                    break
-            
-            address_selectors = [
-                "[data-testid='venue-address']",
-                ".event-details__data--address",
-                ".location-info__address",
-                "p.address"
-            ]
+            venue_elem, selector = _DETAILS_VENUE_SELECTORS.select_first(soup)
+            if venue_elem:
+                venue = venue_elem.get_text(" ", strip=True)
+                logger.debug("Found venue with selector '%s': %s", selector, venue)
             
             address = None
-            for selector in address_selectors:
-                address_elem = soup.select_one(selector)
-                if address_elem:
-                    address = address_elem.get_text().strip()
-                    logger.debug(f"Found address with selector '{selector}': {address}")
-                    break
-            
-            # Extract organizer information with multiple possible selectors
-            org_selectors = [
-                "[data-testid='organizer-name']",
-                ".organizer-name",
-                ".organizer-info__name",
-                "a[href*='/o/']"
-            ]
+            address_elem, selector = _DETAILS_ADDRESS_SELECTORS.select_first(soup)
+            if address_elem:
+                address = address_elem.get_text(" ", strip=True)
+                logger.debug("Found address with selector '%s': %s", selector, address)
             
+            # Extract organizer information
             org_name = None
-            for selector in org_selectors:
-                org_elem = soup.select_one(selector)
-                if org_elem:
-                    org_name = org_elem.get_text().strip()
-                    logger.debug(f"Found organizer name with selector '{selector}': {org_name}")
-                    break
-            
-            org_desc_selectors = [
-                "[data-testid='organizer-description']",
-                ".organizer-description",
-                ".organizer-info__description"
-            ]
+            org_elem, selector = _DETAILS_ORG_SELECTORS.select_first(soup)
+            if org_elem:
+                org_name = org_elem.get_text(" ", strip=True)
+                logger.debug("Found organizer name with selector '%s': %s", selector, org_name)
             
             org_desc = None
-            for selector in org_desc_selectors:
-                org_desc_elem = soup.select_one(selector)
-                if org_desc_elem:
-                    org_desc = org_desc_elem.get_text().strip()
-                    logger.debug(f"Found organizer description with selector '{selector}' (length: {len(org_desc) if org_desc else 0})")
-                    break
-            
-            # Extract price information with multiple possible selectors
-            price_selectors = [
-                "[data-testid='ticket-price']",
-                ".ticket-price",
-                ".eds-text-color--ui-600",
-                "span.price"
-            ]
+            org_desc_elem, selector = _DETAILS_ORG_DESC_SELECTORS.select_first(soup)
+            if org_desc_elem:
+                org_desc = org_desc_elem.get_text().strip()
+                logger.debug("Found organizer description with selector '%s' (length: %d)", selector, len(org_desc) if org_desc else 0)
             
+            # Extract price information
             price_str = ""
-            for selector in price_selectors:
-                price_elem = soup.select_one(selector)
-                if price_elem:
-                    price_str = price_elem.get_text().strip()
-                    logger.debug(f"Found price with selector '{selector}': {price_str}")
-                    break
+            price_elem, selector = _DETAILS_PRICE_SELECTORS.select_first(soup)
+            if price_elem:
+                price_str = price_elem.get_text(" ", strip=True)
+                logger.debug("Found price with selector '%s': %s", selector, price_str)
             
-            is_free = "free" in price_str.lower()
-            
-            # Extract image URL with multiple possible selectors
-            img_selectors = [
-                "[data-testid='event-image']",
-                ".event-header__image img",
-                ".eds-event-details-page__image img",
-                "img.event-image"
-            ]
+            is_free = bool(_FREE_RE.search(price_str))
             
+            # Extract image URL
             image_url = ""
-            for selector in img_selectors:
-                img_elem = soup.select_one(selector)
-                if img_elem:
-                    image_url = img_elem.get("src", "")
-                    logger.debug(f"Found image URL with selector '{selector}': {image_url}")
-                    break
+            img_elem, selector = _DETAILS_IMG_SELECTORS.select_first(soup)
+            if img_elem:
+                image_url = img_elem.get("src", "")
+                logger.debug("Found image URL with selector '%s': %s", selector, image_url)
             
             # Extract categories and tags
             categories = []
             tags = []
             
-            category_selectors = [
-                "[data-testid='event-category']",
-                ".event-category",
-                ".eds-text-color--ui-600"
-            ]
-            
-            for selector in category_selectors:
+            for selector in _DETAILS_CATEGORY_SELECTORS:
                 category_elems = soup.select(selector)
                 for elem in category_elems:
-                    text = elem.get_text().strip()
+                    text = elem.get_text(" ", strip=True)
                     if text and len(text) < 50:  # Avoid picking up long text
                         categories.append(text)
             
-            logger.debug(f"Found categories: {categories}")
-            
-            tag_selectors = [
-                "[data-testid='event-tag']",
-                ".event-tag",
-                ".eds-text-color--ui-600"
-            ]
+            logger.debug("Found categories: %s", categories)
             
-            for selector in tag_selectors:
+            category_set = set(categories)
+            for selector in _DETAILS_TAG_SELECTORS:
                 tag_elems = soup.select(selector)
                 for elem in tag_elems:
-                    text = elem.get_text().strip()
-                    if text and len(text) < 50 and text not in categories:  # Avoid duplicates
+                    text = elem.get_text(" ", strip=True)
+                    if text and len(text) < 50 and text not in category_set:  # Avoid duplicates
                         tags.append(text)
             
-            logger.debug(f"Found tags: {tags}")
+            logger.debug("Found tags: %s", tags)
             
             # Create location object
-            location = Location(
+            location = Location.model_construct(
                 venue=venue,
                 address=address,
                 city=None,  # Would need to parse from address
@@ -508,22 +787,22 @@ class EventParser:
             )
             
             # Create organizer object
-            organizer = Organizer(
+            organizer = Organizer.model_construct(
                 name=org_name,
                 description=org_desc,
                 url=None  # Would need to extract from page
             )
             
             # Create price object
-            price = Price(
+            price = Price.model_construct(
                 currency="USD",  # Default, would need more parsing for accuracy
-                min=0 if is_free else None,  # Would need to parse from price_str
+                min=0.0 if is_free else None,  # Would need to parse from price_str
                 max=None,  # Would need to parse from price_str
                 is_free=is_free
             )
             
             # Create event object
-            event = Event(
+            event = Event.model_construct(
                 id=event_id,
                 title=title,
                 description=description,
@@ -541,9 +820,7 @@ class EventParser:
             return event
             
         except Exception as e:
-            logger.error(f"Error parsing event details: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error parsing event details: {e}")
             return None
     
     def _extract_json_ld(self, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
@@ -563,36 +840,118 @@ class EventParser:
                 logger.debug("No JSON-LD data found")
                 return None
                 
-            logger.debug(f"Found {len(json_ld_scripts)} JSON-LD scripts")
+            logger.debug("Found %d JSON-LD scripts", len(json_ld_scripts))
             
             # Try to find one with event data
-            for script in json_ld_scripts:
+            first_data = None
+            for i, script in enumerate(json_ld_scripts):
                 try:
-                    data = json.loads(script.string)
+                    # orjson only accepts exact str/bytes, so use get_text() rather than the NavigableString
+                    data = orjson.loads(script.get_text())
+                    if i == 0:
+                        first_data = data  # Kept for the fallback below
                     
                     # Check if this is event data
-                    if isinstance(data, dict):
-                        event_type = data.get("@type", "")
-                        if event_type in ["Event", "SocialEvent", "BusinessEvent", "EducationEvent"]:
-                            logger.debug(f"Found JSON-LD data with @type: {event_type}")
-                            return data
-                        
-                        # Some events might not have @type directly but have event properties
-                        if "startDate" in data and "name" in data:
-                            logger.debug("Found JSON-LD data with event properties")
-                            return data
+                    if self._is_event(data):
+                        logger.debug("Found JSON-LD event data with @type: %s", data.get('@type', ''))
+                        return data
                 except Exception as e:
-                    logger.debug(f"Error parsing JSON-LD script: {e}")
+                    logger.debug("Error parsing JSON-LD script: %s", e)
                     continue
             
             # If no event data found, return the first JSON-LD script as fallback
             logger.debug("No event data found in JSON-LD scripts, using first script as fallback")
-            return json.loads(json_ld_scripts[0].string)
+            return first_data
             
         except Exception as e:
             logger.error(f"Error extracting JSON-LD: {e}")
             return None
     
+    def _extract_event_json_ld_fast(self, html_content: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract event JSON-LD data by scanning the raw HTML, without parsing the page.
+        
+        Script contents are raw text in HTML, so each block runs up to the
+        next closing script tag, exactly as an HTML parser would see it.
+        
+        Args:
+            html_content: HTML content of event page
+            
+        Returns:
+            Dictionary of JSON-LD event data if found, None otherwise
+        """
+        for match in _JSON_LD_RE.finditer(html_content):
+            try:
+                data = orjson.loads(match.group(1))
+            except orjson.JSONDecodeError:
+                continue
+            if self._is_event(data):
+                return data
+        
+        return None
+    
+    def _extract_search_json_ld_fast(self, html_content: str) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Extract the events listed in a search page's JSON-LD ItemList blocks.
+        
+        Args:
+            html_content: HTML content of search results page
+            
+        Returns:
+            List of (event ID, event URL, JSON-LD event data) tuples, in page order
+        """
+        items = []
+        seen = set()
+        
+        for match in _JSON_LD_RE.finditer(html_content):
+            try:
+                data = orjson.loads(match.group(1))
+            except orjson.JSONDecodeError:
+                continue
+            
+            blocks = data if isinstance(data, list) else [data]
+            for block in blocks:
+                if not isinstance(block, dict) or block.get("@type") != "ItemList":
+                    continue
+                
+                for element in block.get("itemListElement") or ():
+                    if not isinstance(element, dict):
+                        continue
+                    item = element.get("item", element)
+                    if not self._is_event(item):
+                        continue
+                    
+                    event_url = item.get("url") or ""
+                    if event_url and not event_url.startswith("http"):
+                        event_url = f"https://www.eventbrite.com{event_url}"
+                    event_id_match = _EVENT_ID_RE.search(event_url)
+                    if not event_id_match or event_id_match.group(1) in seen:
+                        continue
+                    
+                    seen.add(event_id_match.group(1))
+                    items.append((event_id_match.group(1), event_url, item))
+        
+        return items
+    
+    def _is_event(self, data: Any) -> bool:
+        """
+        Check whether decoded JSON-LD data describes an event.
+        
+        Args:
+            data: Decoded JSON-LD data
+            
+        Returns:
+            True if data has an event @type or, lacking one, event properties
+        """
+        if not isinstance(data, dict):
+            return False
+        
+        if data.get("@type", "") in _VALID_EVENT_TYPES:
+            return True
+        
+        # Some events might not have @type directly but have event properties
+        return "startDate" in data and "name" in data
+    
     def _parse_from_json_ld(self, data: Dict[str, Any], event_id: str, url: str = "") -> Optional[Event]:
         """
         Parse event details from JSON-LD data.
@@ -608,16 +967,15 @@ class EventParser:
         try:
             # Check if this is event data
             event_type = data.get("@type", "")
-            valid_event_types = ["Event", "SocialEvent", "BusinessEvent", "EducationEvent"]
             
             # If @type is not a valid event type, check if it has event properties
-            if event_type not in valid_event_types:
+            if event_type not in _VALID_EVENT_TYPES:
                 if "startDate" not in data or "name" not in data:
                     logger.warning(f"JSON-LD data is not an Event (type: {event_type}) and doesn't have event properties")
                     return None
                 logger.debug("JSON-LD data doesn't have a valid event type but has event properties")
             else:
-                logger.debug(f"JSON-LD data has valid event type: {event_type}")
+                logger.debug("JSON-LD data has valid event type: %s", event_type)
             
             title = data.get("name", "Unknown Event")
             description = data.get("description", None)
@@ -627,15 +985,15 @@ class EventParser:
             end_date = None
             if "startDate" in data:
                 try:
-                    start_date = datetime.fromisoformat(data["startDate"].replace("Z", "+00:00"))
-                    logger.debug(f"Parsed start date: {start_date}")
+                    start_date = _parse_dt(data["startDate"])
+                    logger.debug("Parsed start date: %s", start_date)
                 except (ValueError, TypeError) as e:
                     logger.warning(f"Failed to parse start date: {e}")
             
             if "endDate" in data:
                 try:
-                    end_date = datetime.fromisoformat(data["endDate"].replace("Z", "+00:00"))
-                    logger.debug(f"Parsed end date: {end_date}")
+                    end_date = _parse_dt(data["endDate"])
+                    logger.debug("Parsed end date: %s", end_date)
                 except (ValueError, TypeError) as e:
                     logger.warning(f"Failed to parse end date: {e}")
             
@@ -644,16 +1002,7 @@ class EventParser:
             venue = location_data.get("name", None)
             address_data = location_data.get("address", {})
             
-            address_parts = []
-            if "streetAddress" in address_data:
-                address_parts.append(address_data["streetAddress"])
-            if "addressLocality" in address_data:
-                address_parts.append(address_data["addressLocality"])
-            if "addressRegion" in address_data:
-                address_parts.append(address_data["addressRegion"])
-            if "postalCode" in address_data:
-                address_parts.append(address_data["postalCode"])
-            
+            address_parts = [v for v in (address_data.get(f) for f in _ADDR_FIELDS) if v]
             address = ", ".join(address_parts) if address_parts else None
             city = address_data.get("addressLocality", None)
             state = address_data.get("addressRegion", None)
@@ -695,34 +1044,29 @@ class EventParser:
             if not isinstance(offers, list):
                 offers = [offers]
             
-            price_min = None
-            price_max = None
+            prices = []
             currency = "USD"
             is_free = False
             
+            # Convert each offer's price once; min/max are taken over the collected list
             for offer in offers:
-                if "price" in offer:
-                    try:
-                        price = float(offer["price"])
-                        if price_min is None or price < price_min:
-                            price_min = price
-                        if price_max is None or price > price_max:
-                            price_max = price
-                    except (ValueError, TypeError):
-                        pass
-                
                 if "priceCurrency" in offer:
                     currency = offer["priceCurrency"]
                 
-                if "availability" in offer and offer["availability"] == "http://schema.org/InStock":
-                    if "price" in offer and float(offer["price"]) == 0:
-                        is_free = True
+                try:
+                    price = float(offer["price"])
+                except (KeyError, ValueError, TypeError):
+                    continue
+                prices.append(price)
+                
+                if price == 0 and offer.get("availability") == "http://schema.org/InStock":
+                    is_free = True
             
             # Create price object
             price = Price(
                 currency=currency,
-                min=price_min,
-                max=price_max,
+                min=min(prices) if prices else None,
+                max=max(prices) if prices else None,
                 is_free=is_free
             )
             
@@ -735,11 +1079,7 @@ class EventParser:
                     image_url = data["image"]
             
             # Parse categories and tags
-            categories = []
-            if "eventAttendanceMode" in data:
-                categories.append(data["eventAttendanceMode"])
-            if "eventStatus" in data:
-                categories.append(data["eventStatus"])
+            categories = [data[k] for k in _CATEGORY_FIELDS if k in data]
             
             # Create event object
             event = Event(
@@ -760,7 +1100,5 @@ class EventParser:
             return event
             
         except Exception as e:
-            logger.error(f"Error parsing from JSON-LD: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error parsing from JSON-LD: {e}")
             return None
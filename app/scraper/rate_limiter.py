@@ -0,0 +1,69 @@
+import time
+import asyncio
+import threading
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces requests to at most `rate` per second.
+    
+    A caller takes a token under a lock and then sleeps outside it until the
+    token is due, so one bucket paces both worker threads and coroutines.
+    After a 429, throttle() halves the rate for a while.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket.
+        
+        Args:
+            rate: Tokens added per second; 0 or less disables rate limiting
+            capacity: Largest burst allowed after an idle period (default: rate, at least 1)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._throttled_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """
+        Take a token, going into debt if none is available.
+        
+        Returns:
+            Seconds to wait before the token may be used
+        """
+        if self.rate <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            rate = self.rate / 2 if now < self._throttled_until else self.rate
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / rate if self._tokens < 0 else 0.0
+    
+    def acquire(self):
+        """Block the calling thread until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait on the event loop until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def throttle(self, duration: float = 60.0):
+        """
+        Halve the rate for the next `duration` seconds.
+        
+        Args:
+            duration: Seconds to stay throttled
+        """
+        with self._lock:
+            self._throttled_until = max(self._throttled_until, time.monotonic() + duration)
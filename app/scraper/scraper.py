@@ -1,32 +1,133 @@
+import re
 import time
+import functools
 import random
+import asyncio
 import requests
-from typing import Dict, List, Optional, Any, Union, Tuple
-from datetime import datetime
+import httpx
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Any, Pattern, Set, Union, Tuple
+from datetime import datetime, timezone
 import urllib.parse
+from email.utils import parsedate_to_datetime
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-import json
-import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse, parse_qs
 
 from app.config import (
     REQUEST_DELAY, 
     MAX_RETRIES, 
+    RETRY_BACKOFF_CAP,
+    MAX_REQUESTS_PER_SECOND,
     USER_AGENT_ROTATION, 
+    SAVE_HTML,
     USER_AGENTS, 
+    CONDITIONAL_CACHE_SIZE,
     EVENTBRITE_BASE_URL,
     EVENTBRITE_SEARCH_URL,
     EVENTBRITE_EVENT_URL,
     logger
 )
-from app.models.event import Event, Location, Organizer, Price, Coordinates
+from app.models.event import Event, SimpleEvent, Location, Organizer, Price, Coordinates
 from app.models.search import SearchRequest
 from app.scraper.parser import EventParser
+from app.scraper.rate_limiter import TokenBucket
+
+
+def _dump_html(filename: str, content: str) -> None:
+    """
+    Save page content to a file for debugging; callers check SAVE_HTML first.
+    
+    Args:
+        filename: File to write, relative to the working directory
+        content: HTML content to save
+    """
+    try:
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(content)
+        logger.info(f"Saved HTML to {filename}")
+    except OSError as e:
+        logger.warning(f"Failed to save HTML to {filename}: {e}")
+
+
+# 'ai' as a whole whitespace-separated word, also written 'a.i.' or 'a.i'
+_AI_WORD_RE = re.compile(r'(?<!\S)(?:ai|a\.i\.?)(?!\S)')
+# Common AI-related terms, matched anywhere in lowercased text
+_AI_TERM_RE = re.compile("|".join(re.escape(term) for term in (
+    'artificial intelligence',
+    'machine learning',
+    'deep learning',
+    'neural network',
+    'data science',
+    'chatgpt',
+    'llm',
+    'large language model',
+    'generative ai',
+    'computer vision',
+    'nlp',
+    'natural language processing'
+)))
+
+
+class _PreparedKeywords(NamedTuple):
+    """Search keywords lowercased and compiled once, for matching against many events."""
+    
+    pattern: Pattern
+    lowered: FrozenSet[str]
+    compounds: Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+@functools.lru_cache(maxsize=512)
+def _format_search_url(
+    country: str,
+    city: str,
+    keyword: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    page: int
+) -> str:
+    """
+    Format an Eventbrite search URL; cached, since the same searches recur.
+    
+    Args:
+        country: Country slug
+        city: City slug
+        keyword: Keyword added to the path (not as a query parameter), if any
+        start_date: Start date filter, if any
+        end_date: End date filter, if any
+        page: Page number
+        
+    Returns:
+        Formatted search URL
+    """
+    url = f"{EVENTBRITE_SEARCH_URL}/{country}--{city}"
+    
+    # Use the keyword as-is in the URL path
+    if keyword is not None:
+        url += f"/{keyword}"
+    
+    query_params = {}
+    if start_date:
+        query_params["start_date"] = start_date
+    if end_date:
+        query_params["end_date"] = end_date
+    if page > 1:
+        query_params["page"] = str(page)
+    
+    if query_params:
+        return f"{url}/?{urllib.parse.urlencode(query_params)}"
+    return f"{url}/"
 
 
 class EventbriteScraper:
@@ -34,25 +135,80 @@ class EventbriteScraper:
     Scraper for extracting event data from Eventbrite.
     """
     
+    # Number of events Eventbrite lists on one search results page
+    RESULTS_PER_PAGE = 20
+    
+    # Content Selenium waits for before reading a page. Search pages carry a JSON-LD
+    # block in the server-rendered HTML, so they wait for the cards rendered by JavaScript
+    SELENIUM_SEARCH_READY_SELECTOR = "[data-testid='event-card'], a[href*='/e/']"
+    SELENIUM_EVENT_READY_SELECTOR = "script[type='application/ld+json']"
+    SELENIUM_READY_TIMEOUT = 10
+    
+    # Threads used by get_event_details_bulk; stays below the session's pool_maxsize
+    DETAIL_WORKERS = 16
+    
+    # Seconds the request rate stays halved after Eventbrite answers 429
+    RATE_LIMIT_THROTTLE_SECONDS = 60
+    
+    # Path of the installed chromedriver, resolved once per process
+    _driver_path: Optional[str] = None
+    _driver_path_lock = threading.Lock()
+    
     def __init__(self, use_selenium: bool = True):
         """
         Initialize the scraper.
         
         Args:
-            use_selenium: Whether to use Selenium for scraping (required for JavaScript-rendered content)
+            use_selenium: Whether to use Selenium for scraping (required for JavaScript-rendered content).
+                The WebDriver is started lazily on the first Selenium request.
         """
         self.session = requests.Session()
+        # Keep a sized pool of warm connections; retries are handled by _get_with_retry
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, pool_block=False, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.use_selenium = use_selenium
         self.driver = None
         self.parser = EventParser()
         self._last_content = None  # Store the last HTML content for debugging
         self.logger = logger
-        
-        if use_selenium:
-            self._setup_selenium()
+        # Guards lazy creation of the WebDriver, which is only started on first use
+        self._driver_lock = threading.Lock()
+        # Validators and body of the last 200 response per URL, replayed as a conditional GET;
+        # kept small since each entry holds a whole page
+        self._validators: LRUCache = LRUCache(maxsize=CONDITIONAL_CACHE_SIZE)
+        self._validators_lock = threading.Lock()
+        # Paces every request to Eventbrite, shared by all threads and coroutines of this
+        # process; each worker process has its own limiter and 429 throttle
+        self._rate_limiter = TokenBucket(MAX_REQUESTS_PER_SECOND)
+        # Thread pool for get_event_details_bulk, started on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
     
     def _setup_selenium(self):
         """Set up Selenium WebDriver."""
+        with self._driver_lock:
+            if self.driver is None:
+                self._start_driver()
+    
+    @classmethod
+    def _get_driver_path(cls) -> str:
+        """
+        Get the chromedriver path, installing or checking it on first use only.
+        
+        ChromeDriverManager().install() checks online for a newer driver on
+        every call, so its result is kept for the life of the process.
+        
+        Returns:
+            Path to the chromedriver executable
+        """
+        with cls._driver_path_lock:
+            if cls._driver_path is None:
+                cls._driver_path = ChromeDriverManager().install()
+            return cls._driver_path
+    
+    def _start_driver(self):
+        """Start a headless Chrome WebDriver."""
         try:
             chrome_options = Options()
             chrome_options.add_argument("--headless")
@@ -60,6 +216,11 @@ class EventbriteScraper:
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument("--disable-extensions")
+            # Images are never parsed, so don't download or decode them
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            # Return from get() at DOMContentLoaded; _get_with_selenium waits for the content it needs
+            chrome_options.page_load_strategy = "eager"
             
             # Add random user agent
             if USER_AGENT_ROTATION:
@@ -67,7 +228,7 @@ class EventbriteScraper:
                 logger.debug(f"Using user agent: {user_agent}")
                 chrome_options.add_argument(f"--user-agent={user_agent}")
             
-            service = Service(ChromeDriverManager().install())
+            service = Service(self._get_driver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             logger.info("Selenium WebDriver initialized successfully")
         except Exception as e:
@@ -79,7 +240,6 @@ class EventbriteScraper:
         headers = {
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
         }
 
@@ -91,6 +251,118 @@ class EventbriteScraper:
 
         return headers
 
+    def _add_conditional_headers(
+        self, key: Tuple[str, Any], headers: Dict[str, str]
+    ) -> Optional[str]:
+        """
+        Add If-None-Match / If-Modified-Since headers for a previously fetched URL.
+        
+        Args:
+            key: Cache key of the request, as built by _conditional_key
+            headers: Request headers to add the validators to
+            
+        Returns:
+            Body of the cached response if the URL was fetched before, None otherwise
+        """
+        with self._validators_lock:
+            cached = self._validators.get(key)
+        if cached is None:
+            return None
+        
+        etag, last_modified, body = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return body
+    
+    def _remember_response(self, key: Tuple[str, Any], response_headers: Any, body: str):
+        """
+        Store the validators and body of a 200 response for later conditional GETs.
+        
+        Args:
+            key: Cache key of the request, as built by _conditional_key
+            response_headers: Response headers (requests or httpx)
+            body: Response text
+        """
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._validators_lock:
+                self._validators[key] = (etag, last_modified, body)
+    
+    @staticmethod
+    def _conditional_key(url: str, params: Optional[Dict[str, Any]]) -> Tuple[str, Any]:
+        """Build the conditional GET cache key for a URL and its query parameters."""
+        return url, tuple(sorted(params.items())) if params else None
+    
+    @staticmethod
+    def _response_text(response: requests.Response) -> str:
+        """
+        Decode a requests response body exactly once.
+        
+        requests re-decodes the body on every access to response.text. When the
+        Content-Type declares no charset it either assumes ISO-8859-1 (for
+        text/* types) or runs charset detection over the whole page; such
+        pages are decoded as UTF-8 instead, which is what Eventbrite serves.
+        
+        Args:
+            response: Successful response
+        
+        Returns:
+            Decoded response body
+        """
+        encoding = "utf-8"
+        if response.encoding and "charset" in response.headers.get("Content-Type", "").lower():
+            encoding = response.encoding
+        try:
+            return response.content.decode(encoding, errors="replace")
+        except LookupError:
+            return response.content.decode("utf-8", errors="replace")
+    
+    @staticmethod
+    def _retry_delay(previous_delay: float, response: Any = None) -> float:
+        """
+        Pick how long to wait before retrying a failed request.
+        
+        A Retry-After header on a 429 or 503 response is honoured; otherwise
+        the delay follows decorrelated jitter backoff, so concurrent retries
+        spread out instead of hitting Eventbrite in lockstep. Both are capped
+        at RETRY_BACKOFF_CAP.
+        
+        Args:
+            previous_delay: Delay waited before the failed attempt
+            response: Failed response (requests or httpx), if one was received
+            
+        Returns:
+            Delay in seconds
+        """
+        if response is not None and response.status_code in (429, 503):
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    try:
+                        delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                    except (TypeError, ValueError):
+                        delay = None
+                if delay is not None:
+                    return min(RETRY_BACKOFF_CAP, max(0.0, delay))
+        
+        return min(RETRY_BACKOFF_CAP, random.uniform(REQUEST_DELAY, previous_delay * 3))
+    
+    def _throttle_if_rate_limited(self, response: Any):
+        """
+        Slow down all further requests for a while after a 429 response.
+        
+        Args:
+            response: Failed response (requests or httpx), if one was received
+        """
+        if response is not None and response.status_code == 429:
+            self.logger.warning(f"Halving request rate for {self.RATE_LIMIT_THROTTLE_SECONDS}s after 429")
+            self._rate_limiter.throttle(self.RATE_LIMIT_THROTTLE_SECONDS)
+    
     def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], int]:
         """
         Make a request to the given URL with retries.
@@ -104,17 +376,19 @@ class EventbriteScraper:
         """
         self.logger.info(f"Making request to {url} with params: {params}")
         
+        delay = REQUEST_DELAY
         for attempt in range(MAX_RETRIES):
+            response = None
             try:
                 # Add delay between requests to avoid being blocked
                 if attempt > 0:
-                    delay = REQUEST_DELAY * (1 + attempt)
                     self.logger.info(f"Retry attempt {attempt+1}/{MAX_RETRIES}. Waiting {delay:.2f} seconds...")
                     time.sleep(delay)
                 
                 headers = self._get_headers()
                 self.logger.debug(f"Request headers: {headers}")
                 
+                self._rate_limiter.acquire()
                 response = self.session.get(
                     url, 
                     headers=headers, 
@@ -129,14 +403,14 @@ class EventbriteScraper:
                 self.logger.debug(f"Response headers: {dict(response.headers)}")
                 
                 if status_code == 200:
-                    content_length = len(response.text)
-                    self.logger.info(f"Received response with content length: {content_length} bytes")
+                    body = self._response_text(response)
+                    self.logger.info(f"Received response with content length: {len(response.content)} bytes")
                     
                     # Save a sample of the response for debugging
-                    sample_size = min(500, content_length)
-                    self.logger.debug(f"Response sample: {response.text[:sample_size]}...")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Response sample: %s...", body[:500])
                     
-                    return response.text, status_code
+                    return body, status_code
                 
                 # Handle specific status codes
                 if status_code == 403:
@@ -145,8 +419,6 @@ class EventbriteScraper:
                     self.logger.warning("Received 404 Not Found - URL may be invalid")
                 elif status_code == 429:
                     self.logger.warning("Received 429 Too Many Requests - rate limited")
-                    # Add longer delay for rate limiting
-                    time.sleep(REQUEST_DELAY * 5)
                 elif status_code >= 500:
                     self.logger.warning(f"Received server error {status_code} - server may be having issues")
                 
@@ -156,7 +428,9 @@ class EventbriteScraper:
                 self.logger.error(f"Request exception on attempt {attempt+1}/{MAX_RETRIES}: {str(e)}")
             
             # If we get here, the request failed
+            self._throttle_if_rate_limited(response)
             if attempt < MAX_RETRIES - 1:
+                delay = self._retry_delay(delay, response)
                 self.logger.info(f"Retrying request to {url}...")
             else:
                 self.logger.error(f"All {MAX_RETRIES} attempts failed for URL: {url}")
@@ -175,67 +449,84 @@ class EventbriteScraper:
             Response text if successful, None otherwise
         """
         logger.debug(f"Making GET request to {url} with params {params}")
+        key = self._conditional_key(url, params)
+        delay = REQUEST_DELAY
         for attempt in range(MAX_RETRIES):
             try:
-                # Add delay to avoid rate limiting
+                # Back off before retrying; the rate limiter paces first attempts
                 if attempt > 0:
-                    time.sleep(REQUEST_DELAY * (attempt + 1))
-                else:
-                    time.sleep(REQUEST_DELAY)
+                    time.sleep(delay)
                 
                 # Rotate user agent if enabled
+                headers = {}
                 if USER_AGENT_ROTATION:
-                    headers = {"User-Agent": random.choice(USER_AGENTS)}
+                    headers["User-Agent"] = random.choice(USER_AGENTS)
                     logger.debug(f"Using user agent: {headers['User-Agent']}")
-                    response = self.session.get(url, params=params, headers=headers, timeout=30)
-                else:
-                    response = self.session.get(url, params=params, timeout=30)
+                cached_body = self._add_conditional_headers(key, headers)
+                self._rate_limiter.acquire()
+                response = self.session.get(url, params=params, headers=headers, timeout=30)
+                
+                if response.status_code == 304 and cached_body is not None:
+                    logger.debug(f"Not modified, reusing cached body for {url}")
+                    self._last_content = cached_body
+                    return cached_body
                 
                 response.raise_for_status()
-                self._last_content = response.text  # Store content for debugging
-                logger.debug(f"Request successful, received {len(response.text)} bytes")
-                return response.text
+                body = self._response_text(response)
+                self._last_content = body  # Store content for debugging
+                self._remember_response(key, response.headers, body)
+                logger.debug(f"Request successful, received {len(response.content)} bytes")
+                return body
             except requests.RequestException as e:
                 logger.warning(f"Request failed (attempt {attempt+1}/{MAX_RETRIES}): {e}")
+                self._throttle_if_rate_limited(e.response)
                 if attempt == MAX_RETRIES - 1:
                     logger.error(f"All retry attempts failed for URL: {url}")
                     return None
+                delay = self._retry_delay(delay, e.response)
     
-    def _get_with_selenium(self, url: str) -> Optional[str]:
+    def _get_with_selenium(self, url: str, ready_selector: str = SELENIUM_SEARCH_READY_SELECTOR) -> Optional[str]:
         """
         Load a page using Selenium and return the page source.
         
         Args:
             url: URL to load
+            ready_selector: CSS selector of the content to wait for; SELENIUM_SEARCH_READY_SELECTOR
+                for search pages, SELENIUM_EVENT_READY_SELECTOR for event pages
             
         Returns:
             Page source if successful, None otherwise
         """
         logger.debug(f"Loading URL with Selenium: {url}")
-        if not self.driver:
+        if self.driver is None:
             self._setup_selenium()
             
         try:
             self.driver.get(url)
-            # Wait for JavaScript to load content
+            # Wait for JavaScript to render the content we parse, but no longer
             logger.debug("Waiting for page to load...")
-            time.sleep(5)
+            try:
+                WebDriverWait(self.driver, self.SELENIUM_READY_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector))
+                )
+            except TimeoutException:
+                logger.warning(f"Timed out waiting for page content after {self.SELENIUM_READY_TIMEOUT}s, using page as is")
             
             # Save screenshot for debugging
-            try:
-                self.driver.save_screenshot("eventbrite_screenshot.png")
-                logger.debug("Screenshot saved to eventbrite_screenshot.png")
-            except Exception as e:
-                logger.warning(f"Failed to save screenshot: {e}")
+            if SAVE_HTML:
+                try:
+                    self.driver.save_screenshot("eventbrite_screenshot.png")
+                    logger.debug("Screenshot saved to eventbrite_screenshot.png")
+                except Exception as e:
+                    logger.warning(f"Failed to save screenshot: {e}")
             
             content = self.driver.page_source
             self._last_content = content  # Store content for debugging
             logger.debug(f"Page loaded successfully, received {len(content)} bytes")
             
             # Save HTML for debugging
-            with open("eventbrite_page.html", "w", encoding="utf-8") as f:
-                f.write(content)
-            logger.debug("HTML content saved to eventbrite_page.html")
+            if SAVE_HTML:
+                _dump_html("eventbrite_page.html", content)
             
             return content
         except Exception as e:
@@ -252,10 +543,6 @@ class EventbriteScraper:
         Returns:
             Formatted search URL
         """
-        # Start with base search URL
-        url = EVENTBRITE_SEARCH_URL
-        
-        # Add location if provided
         country = "spain"  # Default country
         city = "barcelona"  # Default city
         
@@ -268,38 +555,18 @@ class EventbriteScraper:
                     country, city = parts
             else:
                 city = location
-            
-            url += f"/{country}--{city}"
-        else:
-            url += f"/{country}--{city}"
-        
-        # Always add keywords to the path (not as query parameter)
-        if search_params.keywords and len(search_params.keywords) > 0:
-            keyword = search_params.keywords[0]
-            # Use the keyword as-is in the URL path
-            url += f"/{keyword}"
-        
-        # Start query parameters
-        query_params = {}
-        
-        # Add date range if provided
-        if search_params.date_range:
-            if search_params.date_range.start:
-                query_params["start_date"] = search_params.date_range.start
-            if search_params.date_range.end:
-                query_params["end_date"] = search_params.date_range.end
-        
-        # Add page number
-        if search_params.page > 1:
-            query_params["page"] = str(search_params.page)
-        
-        # Build query string
-        if query_params:
-            query_string = urllib.parse.urlencode(query_params)
-            url += f"/?{query_string}"
-        else:
-            url += "/"
         
+        keyword = search_params.keywords[0] if search_params.keywords else None
+        date_range = search_params.date_range
+        
+        url = _format_search_url(
+            country,
+            city,
+            keyword,
+            date_range.start if date_range else None,
+            date_range.end if date_range else None,
+            search_params.page
+        )
         logger.debug(f"Built search URL: {url}")
         return url
     
@@ -348,10 +615,8 @@ class EventbriteScraper:
             return []
         
         # Save HTML content for debugging if needed
-        if os.getenv("SAVE_HTML", "False").lower() in ("true", "1", "t"):
-            with open("eventbrite_search_results.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-            self.logger.info("Saved search results HTML to eventbrite_search_results.html")
+        if SAVE_HTML:
+            _dump_html("eventbrite_search_results.html", html_content)
         
         # Parse events
         try:
@@ -361,9 +626,8 @@ class EventbriteScraper:
         except Exception as e:
             self.logger.exception(f"Error parsing search results: {str(e)}")
             # Save HTML content for debugging when parsing fails
-            with open("eventbrite_failed_parse.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-            self.logger.info("Saved failed parse HTML to eventbrite_failed_parse.html")
+            if SAVE_HTML:
+                _dump_html("eventbrite_failed_parse.html", html_content)
             return []
 
     def search_events(self, search_request: SearchRequest) -> Dict[str, Any]:
@@ -376,51 +640,131 @@ class EventbriteScraper:
         Returns:
             Dictionary with events, total count, page, page size, and search time
         """
-        start_time = time.time()
+        start_time = time.monotonic_ns()
         self.logger.info(f"Searching events with request: {search_request}")
         
-        # Build search URL
-        url = self.build_search_url(search_request)
+        # Make a request for each results page this page of the search spans
+        html_pages = [self._get_with_retry(url) for url in self._build_search_page_urls(search_request)]
         
-        # Make request
-        html_content = self._get_with_retry(url)
+        return self._build_search_result(html_pages, search_request, start_time)
+    
+    def search_events_simple(self, search_request: SearchRequest) -> Dict[str, Any]:
+        """
+        Search for events, returning only their id, title, and url.
         
-        if not html_content:
+        Args:
+            search_request: Search request parameters
+            
+        Returns:
+            Dictionary with simplified events, total count, page, page size, and search time
+        """
+        start_time = time.monotonic_ns()
+        self.logger.info(f"Searching events (simple) with request: {search_request}")
+        
+        html_pages = [self._get_with_retry(url) for url in self._build_search_page_urls(search_request)]
+        
+        return self._build_search_result(html_pages, search_request, start_time, simple=True)
+    
+    def _build_search_page_urls(self, search_request: SearchRequest) -> List[str]:
+        """
+        Build the URLs of the Eventbrite results pages one page of a search spans.
+        
+        A page_size larger than RESULTS_PER_PAGE is served from the consecutive
+        Eventbrite pages covering the page's items; otherwise each page of the
+        search maps to the Eventbrite page with the same number.
+        
+        Args:
+            search_request: Search request parameters
+            
+        Returns:
+            List of search URLs, in page order
+        """
+        if search_request.page_size <= self.RESULTS_PER_PAGE:
+            return [self.build_search_url(search_request)]
+        
+        offset = (search_request.page - 1) * search_request.page_size
+        first_page = offset // self.RESULTS_PER_PAGE + 1
+        last_page = (offset + search_request.page_size - 1) // self.RESULTS_PER_PAGE + 1
+        return [
+            self.build_search_url(search_request.model_copy(update={"page": page}))
+            for page in range(first_page, last_page + 1)
+        ]
+    
+    def _build_search_result(
+        self,
+        html_pages: List[Optional[str]],
+        search_request: SearchRequest,
+        start_time: int,
+        simple: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Parse, filter and package search results fetched for a search request.
+        
+        Args:
+            html_pages: HTML content of each search results page, None for pages that failed
+            search_request: Search request parameters
+            start_time: Time the search started, as returned by time.monotonic_ns()
+            simple: Whether to parse events as SimpleEvent instead of full Event models
+            
+        Returns:
+            Dictionary with events, total count, page, page size, and search time
+        """
+        if not any(html_pages):
             self.logger.error("Failed to get search results")
             return {
                 "events": [],
                 "total_count": 0,
                 "page": search_request.page,
                 "page_size": search_request.page_size,
-                "search_time_ms": int((time.time() - start_time) * 1000)
+                "search_time_ms": (time.monotonic_ns() - start_time) // 1_000_000
             }
         
         # Save HTML content for debugging if needed
-        if os.getenv("SAVE_HTML", "False").lower() in ("true", "1", "t"):
-            with open("eventbrite_search_results.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-            self.logger.info("Saved search results HTML to eventbrite_search_results.html")
+        if SAVE_HTML:
+            for i, html_content in enumerate(html_pages):
+                if html_content:
+                    filename = "eventbrite_search_results.html" if i == 0 else f"eventbrite_search_results_{i + 1}.html"
+                    _dump_html(filename, html_content)
+        
+        # A page_size larger than RESULTS_PER_PAGE spans several Eventbrite pages, which can
+        # start before and end after the requested items; each page is trimmed to the items
+        # it holds of the requested window, so a failed page leaves the others in place
+        offset = (search_request.page - 1) * search_request.page_size
+        first_item = offset - offset % self.RESULTS_PER_PAGE
         
         # Parse events
         try:
-            events = self.parser.parse_search_results(html_content, search_request.page_size)
+            events = []
+            for i, html_content in enumerate(html_pages):
+                if not html_content:
+                    self.logger.warning(f"Results page {i + 1} of {len(html_pages)} failed, returning partial results")
+                    continue
+                
+                if simple:
+                    page_events = self.parser.parse_search_results_simple(html_content)
+                else:
+                    page_events = self.parser.parse_search_results(html_content, self.RESULTS_PER_PAGE)
+                
+                if search_request.page_size > self.RESULTS_PER_PAGE:
+                    page_start = first_item + i * self.RESULTS_PER_PAGE
+                    page_events = page_events[max(0, offset - page_start):offset + search_request.page_size - page_start]
+                events.extend(page_events)
             
-            # Deduplicate events by ID
+            # Deduplicate events by ID, keeping the first occurrence of each
             unique_events = {}
             for event in events:
-                if event.id not in unique_events:
-                    unique_events[event.id] = event
+                unique_events.setdefault(event.id, event)
             
+            self.logger.info("Deduplicated events from %d to %d", len(events), len(unique_events))
             events = list(unique_events.values())
-            self.logger.info(f"Deduplicated events from {len(events)} to {len(unique_events)}")
             
             # Filter events by keywords if provided
             if search_request.keywords and len(search_request.keywords) > 0:
-                filtered_events = []
-                for event in events:
-                    # Check if any keyword is in the title or description (case-insensitive)
-                    if self._matches_keywords(event, search_request.keywords):
-                        filtered_events.append(event)
+                prepared = self._prepare_keywords(search_request.keywords)
+                filtered_events = [
+                    event for event in events
+                    if self._matches_keywords(event, search_request.keywords, prepared)
+                ]
                 
                 self.logger.info(f"Found {len(events)} events, filtered to {len(filtered_events)} events matching keywords")
                 events = filtered_events
@@ -432,7 +776,7 @@ class EventbriteScraper:
                 self.logger.info(f"Limiting results from {len(events)} to {search_request.limit} events")
                 events = events[:search_request.limit]
             
-            search_time_ms = int((time.time() - start_time) * 1000)
+            search_time_ms = (time.monotonic_ns() - start_time) // 1_000_000
             
             return {
                 "events": events,
@@ -444,25 +788,65 @@ class EventbriteScraper:
         except Exception as e:
             self.logger.exception(f"Error parsing search results: {str(e)}")
             # Save HTML content for debugging when parsing fails
-            with open("eventbrite_failed_parse.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-            self.logger.info("Saved failed parse HTML to eventbrite_failed_parse.html")
+            if SAVE_HTML:
+                _dump_html("eventbrite_failed_parse.html", "\n".join(html_pages))
             
             return {
                 "events": [],
                 "total_count": 0,
                 "page": search_request.page,
                 "page_size": search_request.page_size,
-                "search_time_ms": int((time.time() - start_time) * 1000)
+                "search_time_ms": (time.monotonic_ns() - start_time) // 1_000_000
             }
     
-    def _matches_keywords(self, event: Event, keywords: List[str]) -> bool:
+    @staticmethod
+    def _compile_keywords(keywords: List[str]) -> Pattern:
+        """
+        Compile keywords into one regex that finds any of them in lowercased text.
+        
+        Args:
+            keywords: List of keywords
+            
+        Returns:
+            Compiled alternation of the lowercased, escaped keywords
+        """
+        return re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords))
+    
+    @classmethod
+    def _prepare_keywords(cls, keywords: List[str]) -> _PreparedKeywords:
+        """
+        Lowercase, compile and split keywords once per search rather than per event.
+        
+        Args:
+            keywords: List of keywords
+            
+        Returns:
+            Prepared keywords for _matches_keywords
+        """
+        lowered = [keyword.lower() for keyword in keywords]
+        return _PreparedKeywords(
+            pattern=cls._compile_keywords(lowered),
+            lowered=frozenset(lowered),
+            compounds=tuple(
+                (keyword, tuple(keyword_lower.split('-')))
+                for keyword, keyword_lower in zip(keywords, lowered)
+                if '-' in keyword_lower
+            )
+        )
+    
+    def _matches_keywords(
+        self,
+        event: Union[Event, SimpleEvent],
+        keywords: List[str],
+        prepared: Optional[_PreparedKeywords] = None
+    ) -> bool:
         """
         Check if an event matches any of the provided keywords.
         
         Args:
-            event: Event to check
+            event: Event to check; a SimpleEvent is matched on its title and url only
             keywords: List of keywords to match against
+            prepared: Keywords from _prepare_keywords; built here if not given
             
         Returns:
             True if the event matches any keyword, False otherwise
@@ -470,118 +854,61 @@ class EventbriteScraper:
         if not keywords:
             return True
         
+        # Fields that SimpleEvent does not carry are treated as empty
+        description = getattr(event, "description", None)
+        
         # Convert event title and description to lowercase for case-insensitive matching
         title = event.title.lower() if event.title else ""
-        description = event.description.lower() if event.description else ""
-        
-        # Get categories and tags as lowercase strings
-        categories = [cat.lower() for cat in event.categories] if event.categories else []
-        tags = [tag.lower() for tag in event.tags] if event.tags else []
+        description = description.lower() if description else ""
         
         # URL might contain additional information
         url = event.url.lower() if event.url else ""
         
         # Special handling for 'ai' keyword to avoid false positives
         if 'ai' in keywords and len(keywords) == 1:
-            # List of common AI-related terms
-            ai_terms = [
-                'artificial intelligence', 
-                'machine learning', 
-                'deep learning', 
-                'neural network',
-                'data science',
-                'chatgpt',
-                'llm',
-                'large language model',
-                'generative ai',
-                'computer vision',
-                'nlp',
-                'natural language processing'
-            ]
-            
-            # Check for whole word 'ai' with word boundaries
-            ai_whole_word = False
-            
-            # Check in title
-            title_words = title.split()
-            for word in title_words:
-                if word == 'ai' or word == 'a.i.' or word == 'a.i':
-                    ai_whole_word = True
-                    self.logger.debug(f"Event {event.id} matches 'ai' as whole word in title")
-                    break
-            
-            # Check in description if not found in title
-            if not ai_whole_word and description:
-                description_words = description.split()
-                for word in description_words:
-                    if word == 'ai' or word == 'a.i.' or word == 'a.i':
-                        ai_whole_word = True
-                        self.logger.debug(f"Event {event.id} matches 'ai' as whole word in description")
-                        break
+            # Whole word 'ai' in the title or description
+            match = _AI_WORD_RE.search(f"{title}\n{description}")
+            if match:
+                self.logger.debug(f"Event {event.id} matches '{match.group()}' as whole word")
+                return True
             
-            # Check for AI-related terms
-            ai_term_found = False
-            for term in ai_terms:
-                if term in title or term in description or term in url:
-                    ai_term_found = True
-                    self.logger.debug(f"Event {event.id} matches AI-related term '{term}'")
-                    break
-            
-            # Return true only if we found a whole word 'ai' or an AI-related term
-            return ai_whole_word or ai_term_found
-        
-        # Handle compound keywords (e.g., "machine-learning")
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            
-            # Check if it's a compound keyword with hyphens
-            if '-' in keyword_lower:
-                # Split into individual words
-                individual_words = keyword_lower.split('-')
-                
-                # Check if all individual words appear in the title or description
-                all_words_in_title = all(word in title for word in individual_words)
-                all_words_in_description = description and all(word in description for word in individual_words)
-                
-                # Check for exact compound match
-                compound_match = keyword_lower in title or keyword_lower in description or keyword_lower in url
-                
-                if compound_match:
-                    self.logger.debug(f"Event {event.id} matches compound keyword '{keyword}' (exact match)")
-                    return True
-                
-                if all_words_in_title:
-                    self.logger.debug(f"Event {event.id} matches all words from compound keyword '{keyword}' in title")
-                    return True
-                
-                if all_words_in_description:
-                    self.logger.debug(f"Event {event.id} matches all words from compound keyword '{keyword}' in description")
-                    return True
-            
-            # For regular keywords, use the original matching logic
-            # Check for exact matches
-            if (keyword_lower in title or 
-                keyword_lower in description or 
-                keyword_lower in categories or 
-                keyword_lower in tags or
-                keyword_lower in url):
-                self.logger.debug(f"Event {event.id} matches keyword '{keyword}' (exact match)")
+            # AI-related terms anywhere in the title, description or url
+            match = _AI_TERM_RE.search(f"{title}\n{description}\n{url}")
+            if match:
+                self.logger.debug(f"Event {event.id} matches AI-related term '{match.group()}'")
+                return True
+            
+            return False
+        
+        if prepared is None:
+            prepared = self._prepare_keywords(keywords)
+        
+        # Exact matches: any keyword inside the title, description or url,
+        # found with a single scan of each field
+        for field in (title, description, url):
+            match = prepared.pattern.search(field)
+            if match:
+                self.logger.debug(f"Event {event.id} matches keyword '{match.group()}' (exact match)")
+                return True
+        
+        # Categories and tags must match a keyword as a whole
+        labels = {label.lower() for label in getattr(event, "categories", None) or ()}
+        labels.update(label.lower() for label in getattr(event, "tags", None) or ())
+        
+        if not labels.isdisjoint(prepared.lowered):
+            self.logger.debug(f"Event {event.id} matches keywords {sorted(labels & prepared.lowered)} (category or tag)")
+            return True
+        
+        # Compound keywords with hyphens (e.g., "machine-learning") also match
+        # when all of their words appear in the title or in the description
+        for keyword, individual_words in prepared.compounds:
+            if all(word in title for word in individual_words):
+                self.logger.debug(f"Event {event.id} matches all words from compound keyword '{keyword}' in title")
                 return True
             
-            # Check for word boundary matches in title
-            title_words = title.split()
-            for word in title_words:
-                if keyword_lower == word or word.startswith(keyword_lower + " ") or word.endswith(" " + keyword_lower):
-                    self.logger.debug(f"Event {event.id} matches keyword '{keyword}' (word match in title)")
-                    return True
-            
-            # Check for word boundary matches in description
-            if description:
-                description_words = description.split()
-                for word in description_words:
-                    if keyword_lower == word or word.startswith(keyword_lower + " ") or word.endswith(" " + keyword_lower):
-                        self.logger.debug(f"Event {event.id} matches keyword '{keyword}' (word match in description)")
-                        return True
+            if description and all(word in description for word in individual_words):
+                self.logger.debug(f"Event {event.id} matches all words from compound keyword '{keyword}' in description")
+                return True
         
         return False
 
@@ -614,11 +941,40 @@ class EventbriteScraper:
                 self.logger.error(f"Failed to get event details for ID: {event_id}")
                 return None
         
+        return self._parse_event_page(html_content, event_id)
+    
+    def get_event_details_bulk(self, event_ids: List[str]) -> List[Optional[Event]]:
+        """
+        Get details for several events concurrently on a thread pool.
+        
+        Args:
+            event_ids: Event IDs
+            
+        Returns:
+            List of Event objects (or None when not found), in the order of event_ids
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.DETAIL_WORKERS,
+                    thread_name_prefix="event-details"
+                )
+        return list(self._executor.map(self.get_event_details, event_ids))
+    
+    def _parse_event_page(self, html_content: str, event_id: str) -> Optional[Event]:
+        """
+        Parse the HTML of an event page into an Event.
+        
+        Args:
+            html_content: HTML content of the event page
+            event_id: Event ID
+            
+        Returns:
+            Event object or None if parsing failed
+        """
         # Save HTML content for debugging if needed
-        if os.getenv("SAVE_HTML", "False").lower() in ("true", "1", "t"):
-            with open(f"eventbrite_event_{event_id}.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-            self.logger.info(f"Saved event details HTML to eventbrite_event_{event_id}.html")
+        if SAVE_HTML:
+            _dump_html(f"eventbrite_event_{event_id}.html", html_content)
         
         # Parse event details
         try:
@@ -631,9 +987,8 @@ class EventbriteScraper:
         except Exception as e:
             self.logger.exception(f"Error parsing event details: {str(e)}")
             # Save HTML content for debugging when parsing fails
-            with open(f"eventbrite_event_{event_id}_failed_parse.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-            self.logger.info(f"Saved failed parse HTML to eventbrite_event_{event_id}_failed_parse.html")
+            if SAVE_HTML:
+                _dump_html(f"eventbrite_event_{event_id}_failed_parse.html", html_content)
             return None
     
     def close(self):
@@ -641,4 +996,310 @@ class EventbriteScraper:
         if self.driver:
             self.driver.quit()
             self.driver = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         self.session.close()
+
+
+class AsyncEventbriteScraper(EventbriteScraper):
+    """
+    Asynchronous scraper that fetches Eventbrite pages over a pooled httpx client.
+    
+    URL building, parsing and filtering are shared with EventbriteScraper; only
+    the network layer is replaced so that many fetches can run concurrently on
+    the event loop.
+    
+    Event detail lookups are micro-batched: requests arriving within
+    DETAIL_BATCH_WAIT seconds of each other are collected (up to
+    DETAIL_BATCH_SIZE) and duplicate IDs are fetched once. Each batch is
+    fetched in its own task, so a slow lookup never holds up later batches;
+    at most DETAIL_BATCH_SIZE event pages are fetched at any one time.
+    """
+    
+    DETAIL_BATCH_SIZE = 16
+    DETAIL_BATCH_WAIT = 0.02
+    
+    def __init__(self):
+        """Initialize the scraper without Selenium; the HTTP client is created lazily."""
+        super().__init__(use_selenium=False)
+        self._client: Optional[httpx.AsyncClient] = None
+        # Created on first use so they bind to the running event loop
+        self._detail_queue: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+        self._detail_batcher: Optional["asyncio.Task[None]"] = None
+        self._detail_batches: Set["asyncio.Task[None]"] = set()
+        self._detail_semaphore: Optional[asyncio.Semaphore] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                timeout=30,
+                follow_redirects=True
+            )
+        return self._client
+    
+    async def _aget_with_retry(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Make an asynchronous GET request with retry logic.
+        
+        Args:
+            url: URL to request
+            params: Query parameters
+            
+        Returns:
+            Response text if successful, None otherwise
+        """
+        logger.debug(f"Making async GET request to {url} with params {params}")
+        client = self._get_client()
+        key = self._conditional_key(url, params)
+        delay = REQUEST_DELAY
+        for attempt in range(MAX_RETRIES):
+            try:
+                # Back off before retrying; the rate limiter paces first attempts
+                if attempt > 0:
+                    await asyncio.sleep(delay)
+                
+                # Rotate user agent if enabled
+                headers = {}
+                if USER_AGENT_ROTATION:
+                    headers["User-Agent"] = random.choice(USER_AGENTS)
+                    logger.debug(f"Using user agent: {headers['User-Agent']}")
+                cached_body = self._add_conditional_headers(key, headers)
+                await self._rate_limiter.acquire_async()
+                response = await client.get(url, params=params, headers=headers)
+                
+                if response.status_code == 304 and cached_body is not None:
+                    logger.debug(f"Not modified, reusing cached body for {url}")
+                    self._last_content = cached_body
+                    return cached_body
+                
+                response.raise_for_status()
+                body = response.text
+                self._last_content = body  # Store content for debugging
+                self._remember_response(key, response.headers, body)
+                logger.debug(f"Request successful, received {len(response.content)} bytes")
+                return body
+            except httpx.HTTPError as e:
+                logger.warning(f"Request failed (attempt {attempt+1}/{MAX_RETRIES}): {e}")
+                # Only status errors carry a response
+                failed_response = getattr(e, "response", None)
+                self._throttle_if_rate_limited(failed_response)
+                if attempt == MAX_RETRIES - 1:
+                    logger.error(f"All retry attempts failed for URL: {url}")
+                    return None
+                delay = self._retry_delay(delay, failed_response)
+    
+    async def search_events(self, search_request: SearchRequest) -> Dict[str, Any]:
+        """
+        Search for events using the SearchRequest model.
+        
+        Args:
+            search_request: Search request parameters
+            
+        Returns:
+            Dictionary with events, total count, page, page size, and search time
+        """
+        start_time = time.monotonic_ns()
+        self.logger.info(f"Searching events with request: {search_request}")
+        
+        html_pages = await self._aget_search_pages(search_request)
+        
+        # Parsing is CPU-bound, so keep it off the event loop
+        return await asyncio.to_thread(self._build_search_result, html_pages, search_request, start_time)
+    
+    async def search_events_simple(self, search_request: SearchRequest) -> Dict[str, Any]:
+        """
+        Search for events, returning only their id, title, and url.
+        
+        Args:
+            search_request: Search request parameters
+            
+        Returns:
+            Dictionary with simplified events, total count, page, page size, and search time
+        """
+        start_time = time.monotonic_ns()
+        self.logger.info(f"Searching events (simple) with request: {search_request}")
+        
+        html_pages = await self._aget_search_pages(search_request)
+        
+        return await asyncio.to_thread(
+            self._build_search_result, html_pages, search_request, start_time, True
+        )
+    
+    async def _aget_search_pages(self, search_request: SearchRequest) -> List[Optional[str]]:
+        """
+        Fetch every results page one page of a search spans, concurrently.
+        
+        Args:
+            search_request: Search request parameters
+            
+        Returns:
+            HTML content of each page in page order, None for pages that failed
+        """
+        urls = self._build_search_page_urls(search_request)
+        return list(await asyncio.gather(*(self._aget_with_retry(url) for url in urls)))
+    
+    async def get_event_details(self, event_id: str) -> Optional[Event]:
+        """
+        Get details for a specific event.
+        
+        The lookup is queued and fetched together with other lookups that
+        arrive in the same batching window.
+        
+        Args:
+            event_id: Event ID
+            
+        Returns:
+            Event object or None if not found
+        """
+        if self._detail_queue is None:
+            self._detail_queue = asyncio.Queue()
+            self._detail_semaphore = asyncio.Semaphore(self.DETAIL_BATCH_SIZE)
+        if self._detail_batcher is None or self._detail_batcher.done():
+            self._detail_batcher = asyncio.create_task(self._run_detail_batcher())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._detail_queue.put((event_id, future))
+        return await future
+    
+    async def _run_detail_batcher(self):
+        """Drain queued detail lookups in batches and resolve their futures."""
+        loop = asyncio.get_running_loop()
+        queue = self._detail_queue
+        
+        while True:
+            batch = [await queue.get()]
+            try:
+                deadline = loop.time() + self.DETAIL_BATCH_WAIT
+                while len(batch) < self.DETAIL_BATCH_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Closed while collecting: the lookups taken off the queue will never run
+                self._fail_waiters(future for _, future in batch)
+                raise
+            
+            # Fetch each distinct ID once, however many callers asked for it
+            waiters: Dict[str, List[asyncio.Future]] = {}
+            for event_id, future in batch:
+                waiters.setdefault(event_id, []).append(future)
+            
+            self.logger.debug(f"Fetching batch of {len(waiters)} event details for {len(batch)} requests")
+            # Run the batch on its own so a slow lookup does not hold up the next batch
+            task = asyncio.create_task(self._resolve_batch(waiters))
+            self._detail_batches.add(task)
+            task.add_done_callback(self._detail_batches.discard)
+    
+    async def _resolve_batch(self, waiters: Dict[str, List[asyncio.Future]]):
+        """
+        Fetch a batch of event details concurrently and resolve their futures.
+        
+        Args:
+            waiters: Futures waiting on each distinct event ID of the batch
+        """
+        try:
+            results = await asyncio.gather(
+                *(self._fetch_event_details_limited(event_id) for event_id in waiters),
+                return_exceptions=True
+            )
+            
+            for futures, result in zip(waiters.values(), results):
+                for future in futures:
+                    if future.done():
+                        continue  # The caller went away
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            # Only left unresolved when the batch was cancelled by aclose()
+            self._fail_waiters(future for futures in waiters.values() for future in futures)
+    
+    @staticmethod
+    def _fail_waiters(futures: Iterable[asyncio.Future]):
+        """
+        Fail lookups that will never be fetched because the scraper is closing.
+        
+        Args:
+            futures: Futures of the callers waiting on the lookups
+        """
+        for future in futures:
+            if not future.done():
+                future.set_exception(RuntimeError("Scraper closed before the event details were fetched"))
+    
+    async def _fetch_event_details_limited(self, event_id: str) -> Optional[Event]:
+        """Fetch event details, waiting while DETAIL_BATCH_SIZE fetches are already running."""
+        async with self._detail_semaphore:
+            return await self._fetch_event_details(event_id)
+    
+    async def _fetch_event_details(self, event_id: str) -> Optional[Event]:
+        """
+        Fetch and parse the page of a specific event.
+        
+        Args:
+            event_id: Event ID
+            
+        Returns:
+            Event object or None if not found
+        """
+        self.logger.info(f"Getting details for event ID: {event_id}")
+        
+        url = f"{EVENTBRITE_EVENT_URL}/event-tickets-{event_id}"
+        self.logger.debug(f"Fetching event details from URL: {url}")
+        
+        html_content = await self._aget_with_retry(url)
+        
+        if not html_content:
+            # Try alternative URL format as fallback
+            alt_url = f"{EVENTBRITE_BASE_URL}/e/tickets-{event_id}"
+            self.logger.debug(f"First attempt failed, trying alternative URL: {alt_url}")
+            html_content = await self._aget_with_retry(alt_url)
+            
+            if not html_content:
+                self.logger.error(f"Failed to get event details for ID: {event_id}")
+                return None
+        
+        return await asyncio.to_thread(self._parse_event_page, html_content, event_id)
+    
+    async def get_event_details_bulk(self, event_ids: List[str]) -> List[Optional[Event]]:
+        """
+        Get details for several events concurrently.
+        
+        Args:
+            event_ids: Event IDs
+            
+        Returns:
+            List of Event objects (or None when not found), in the order of event_ids
+        """
+        return list(await asyncio.gather(*(self.get_event_details(event_id) for event_id in event_ids)))
+    
+    async def aclose(self):
+        """Close the HTTP client and release resources."""
+        if self._detail_batcher is not None:
+            self._detail_batcher.cancel()
+            try:
+                await self._detail_batcher
+            except asyncio.CancelledError:
+                pass
+            self._detail_batcher = None
+        for task in list(self._detail_batches):
+            task.cancel()
+        if self._detail_batches:
+            await asyncio.gather(*self._detail_batches, return_exceptions=True)
+        if self._detail_queue is not None:
+            while not self._detail_queue.empty():
+                _, future = self._detail_queue.get_nowait()
+                self._fail_waiters((future,))
+            self._detail_queue = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.close()
@@ -4,13 +4,20 @@ Script to run the Eventbrite Scraper API.
 """
 
 import uvicorn
-from app.config import API_HOST, API_PORT, DEBUG, logger
+from app.config import API_HOST, API_PORT, DEBUG, WEB_CONCURRENCY, logger
 
 if __name__ == "__main__":
     logger.info(f"Starting server on {API_HOST}:{API_PORT}")
+    # uvicorn cannot reload with multiple workers, so debug mode runs a single one
     uvicorn.run(
         "app.main:app",
         host=API_HOST,
         port=API_PORT,
-        reload=DEBUG
+        reload=DEBUG,
+        workers=1 if DEBUG else WEB_CONCURRENCY,
+        loop="uvloop",
+        http="httptools",
+        log_level="debug" if DEBUG else "info",
+        # Skip formatting a log line per request outside debug mode
+        access_log=DEBUG
     ) 
\ No newline at end of file
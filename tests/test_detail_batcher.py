@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from app.scraper.scraper import AsyncEventbriteScraper
+
+
+def _scraper_with_fetch(fetch) -> AsyncEventbriteScraper:
+    """Build an async scraper whose event page fetches are replaced by fetch."""
+    scraper = AsyncEventbriteScraper()
+    scraper._fetch_event_details = fetch
+    return scraper
+
+
+def test_lookup_in_flight_fails_when_scraper_closes():
+    async def slow_fetch(event_id):
+        await asyncio.sleep(10)
+    
+    async def run():
+        scraper = _scraper_with_fetch(slow_fetch)
+        lookup = asyncio.create_task(scraper.get_event_details("1"))
+        await asyncio.sleep(0.1)  # Let the batch start fetching
+        await scraper.aclose()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(lookup, 1)
+    
+    asyncio.run(run())
+
+
+def test_lookup_still_batching_fails_when_scraper_closes():
+    async def fetch(event_id):
+        return event_id
+    
+    async def run():
+        scraper = _scraper_with_fetch(fetch)
+        scraper.DETAIL_BATCH_WAIT = 10
+        lookup = asyncio.create_task(scraper.get_event_details("1"))
+        await asyncio.sleep(0.1)  # Taken off the queue, waiting for more lookups
+        await scraper.aclose()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(lookup, 1)
+    
+    asyncio.run(run())
+
+
+def test_queued_lookup_fails_when_scraper_closes():
+    async def fetch(event_id):
+        return event_id
+    
+    async def run():
+        scraper = _scraper_with_fetch(fetch)
+        lookup = asyncio.create_task(scraper.get_event_details("1"))
+        await asyncio.sleep(0)  # Queued, but the batcher has not run yet
+        await scraper.aclose()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(lookup, 1)
+    
+    asyncio.run(run())
+
+
+def test_duplicate_lookups_are_fetched_once():
+    fetched = []
+    
+    async def fetch(event_id):
+        fetched.append(event_id)
+        await asyncio.sleep(0.01)
+        return f"event {event_id}"
+    
+    async def run():
+        scraper = _scraper_with_fetch(fetch)
+        results = await asyncio.gather(*(scraper.get_event_details(event_id) for event_id in ["1", "2", "1", "1"]))
+        await scraper.aclose()
+        return results
+    
+    assert asyncio.run(run()) == ["event 1", "event 2", "event 1", "event 1"]
+    assert sorted(fetched) == ["1", "2"]
+
+
+def test_slow_lookup_does_not_hold_up_later_batches():
+    async def fetch(event_id):
+        await asyncio.sleep(10 if event_id == "slow" else 0.01)
+        return event_id
+    
+    async def run():
+        scraper = _scraper_with_fetch(fetch)
+        slow = asyncio.create_task(scraper.get_event_details("slow"))
+        await asyncio.sleep(0.1)  # The slow lookup's batch is now fetching
+        assert await asyncio.wait_for(scraper.get_event_details("fast"), 1) == "fast"
+        await scraper.aclose()
+        with pytest.raises(RuntimeError):
+            await slow
+    
+    asyncio.run(run())
+
+
+def test_concurrent_fetches_are_capped_at_batch_size():
+    running = 0
+    peak = 0
+    
+    async def fetch(event_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return event_id
+    
+    async def run():
+        scraper = _scraper_with_fetch(fetch)
+        event_ids = [str(i) for i in range(100)]
+        assert await asyncio.gather(*(scraper.get_event_details(event_id) for event_id in event_ids)) == event_ids
+        await scraper.aclose()
+    
+    asyncio.run(run())
+    assert peak == AsyncEventbriteScraper.DETAIL_BATCH_SIZE
+
+
+def test_fetch_error_is_raised_to_every_caller_of_the_id():
+    async def fetch(event_id):
+        raise ValueError(event_id)
+    
+    async def run():
+        scraper = _scraper_with_fetch(fetch)
+        results = await asyncio.gather(
+            scraper.get_event_details("1"), scraper.get_event_details("1"), return_exceptions=True
+        )
+        await scraper.aclose()
+        return results
+    
+    assert [type(result) for result in asyncio.run(run())] == [ValueError, ValueError]
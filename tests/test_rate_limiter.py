@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import pytest
+
+from app.scraper.rate_limiter import TokenBucket
+
+
+def test_tokens_are_spaced_by_the_rate():
+    bucket = TokenBucket(10, capacity=1)
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket._reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_throttle_halves_the_rate():
+    bucket = TokenBucket(10, capacity=1)
+    bucket.throttle(60)
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_throttle_expires():
+    bucket = TokenBucket(10, capacity=1)
+    bucket.throttle(0.05)
+    time.sleep(0.1)
+    assert bucket._reserve() == 0
+    assert bucket._reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_throttle_does_not_shorten_a_longer_throttle():
+    bucket = TokenBucket(10, capacity=1)
+    bucket.throttle(60)
+    bucket.throttle(0)
+    bucket._reserve()
+    assert bucket._reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_zero_rate_disables_limiting():
+    bucket = TokenBucket(0)
+    assert all(bucket._reserve() == 0 for _ in range(100))
+
+
+def test_concurrent_coroutines_share_the_rate():
+    bucket = TokenBucket(50, capacity=1)
+    
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+        return time.monotonic() - start
+    
+    # The first token is free, the other five are 20 ms apart
+    assert asyncio.run(run()) >= 0.09
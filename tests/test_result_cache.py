@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from app.api import routes
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    routes.result_cache.clear()
+    routes._in_flight.clear()
+    yield
+    routes.result_cache.clear()
+    routes._in_flight.clear()
+
+
+def test_concurrent_misses_share_one_fetch():
+    calls = 0
+    
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"events": []}
+    
+    async def run():
+        return await asyncio.gather(*(routes.get_cached("key", fetch) for _ in range(5)))
+    
+    results = asyncio.run(run())
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert routes.result_cache["key"] is results[0]
+    assert not routes._in_flight
+
+
+def test_cached_result_is_served_without_fetching():
+    async def fetch():
+        raise AssertionError("fetched despite a cached result")
+    
+    routes.result_cache["key"] = "cached"
+    assert asyncio.run(routes.get_cached("key", fetch)) == "cached"
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_fetch():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "result"
+    
+    async def run():
+        first = asyncio.create_task(routes.get_cached("key", fetch))
+        second = asyncio.create_task(routes.get_cached("key", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+    
+    assert asyncio.run(run()) == "result"
+    assert routes.result_cache["key"] == "result"
+
+
+def test_failed_fetch_is_not_cached():
+    calls = 0
+    
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        raise ValueError("upstream failed")
+    
+    async def run():
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await routes.get_cached("key", fetch)
+    
+    asyncio.run(run())
+    assert calls == 2
+    assert "key" not in routes.result_cache
+    assert not routes._in_flight
+
+
+def test_uncacheable_result_is_not_cached():
+    async def fetch():
+        return None
+    
+    assert asyncio.run(routes.get_cached("key", fetch)) is None
+    assert "key" not in routes.result_cache
@@ -0,0 +1,76 @@
+import time
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.models.search import SearchRequest
+from app.scraper.scraper import EventbriteScraper
+
+
+def _page_numbers(urls):
+    """Eventbrite page number requested by each search URL."""
+    return [int(parse_qs(urlparse(url).query).get("page", ["1"])[0]) for url in urls]
+
+
+def _results_page(page: int) -> str:
+    """Eventbrite results page whose events are numbered by their position in the whole search."""
+    cards = "".join(
+        f"<div data-testid='event-card'><a href='/e/event-tickets-{(page - 1) * 20 + i}'>x</a><h3>Event</h3></div>"
+        for i in range(1, 21)
+    )
+    return f"<html><body>{cards}</body></html>"
+
+
+def _event_ids(scraper, search_request, failed_pages=()):
+    """Ids of the events returned for a search, with the given Eventbrite pages failing."""
+    pages = _page_numbers(scraper._build_search_page_urls(search_request))
+    html_pages = [None if page in failed_pages else _results_page(page) for page in pages]
+    result = scraper._build_search_result(html_pages, search_request, time.monotonic_ns(), simple=True)
+    return [int(event.id) for event in result["events"]]
+
+
+@pytest.fixture
+def scraper():
+    scraper = EventbriteScraper(use_selenium=False)
+    yield scraper
+    scraper.close()
+
+
+@pytest.mark.parametrize("page, page_size, expected", [
+    (1, 20, [1]),
+    (3, 20, [3]),
+    (2, 10, [2]),
+    (1, 50, [1, 2, 3]),
+    (2, 50, [3, 4, 5]),
+    (3, 50, [6, 7, 8]),
+    (2, 45, [3, 4, 5]),
+    (2, 40, [3, 4]),
+    (2, 100, [6, 7, 8, 9, 10]),
+])
+def test_search_pages_cover_requested_items(scraper, page, page_size, expected):
+    urls = scraper._build_search_page_urls(SearchRequest(page=page, page_size=page_size))
+    assert _page_numbers(urls) == expected
+
+
+@pytest.mark.parametrize("page_size", [21, 30, 45, 50, 100])
+def test_consecutive_pages_return_every_item_once(scraper, page_size):
+    ids = []
+    for page in range(1, 5):
+        ids += _event_ids(scraper, SearchRequest(page=page, page_size=page_size))
+    assert ids == list(range(1, 4 * page_size + 1))
+
+
+def test_failed_first_page_keeps_the_rest_in_place(scraper):
+    # Items 51-100 span Eventbrite pages 3-5
+    ids = _event_ids(scraper, SearchRequest(page=2, page_size=50), failed_pages={3})
+    assert ids == list(range(61, 101))
+
+
+def test_failed_last_page_only_drops_its_own_items(scraper):
+    ids = _event_ids(scraper, SearchRequest(page=2, page_size=50), failed_pages={5})
+    assert ids == list(range(51, 81))
+
+
+def test_failed_middle_page_only_drops_its_own_items(scraper):
+    ids = _event_ids(scraper, SearchRequest(page=2, page_size=50), failed_pages={4})
+    assert ids == list(range(51, 61)) + list(range(81, 101))